@@ -0,0 +1,218 @@
+import time
+import random
+import asyncio
+import threading
+
+from place_fetcher import HttpPlaceFetcher, PlaceFetchError, PlaceBlockedError, fetch_outcome
+from metrics import CrawlMetrics
+from throttle import AdaptiveThrottle, OK, ERROR
+
+# 재시도할 HTTP 상태 (None = 연결 오류 등 응답 없음)
+RETRY_STATUSES = {None, 429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    # 초당 rate개 토큰, 최대 capacity개까지 모아둘 수 있는 요청 속도 제한기
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity or max(1.0, rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+async def retry_with_backoff(func, retries=3, base_delay=0.5, max_delay=8.0, should_retry=None, on_retry=None):
+    # 지수 백오프 + 지터로 재시도. 마지막 실패는 그대로 예외로 올린다.
+    attempt = 0
+    while True:
+        try:
+            return await func()
+        except Exception as e:
+            if attempt >= retries or (should_retry is not None and not should_retry(e)):
+                raise
+            if on_retry is not None:
+                on_retry(e)
+            delay = min(max_delay, base_delay * (2 ** attempt))
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+            attempt += 1
+
+
+def is_retryable(error):
+    # 차단된 요청은 속도 조절기가 쉬는 시간을 지난 뒤 다시 시도한다.
+    return isinstance(error, PlaceBlockedError) or (isinstance(error, PlaceFetchError) and error.status in RETRY_STATUSES)
+
+
+class AsyncCrawlEngine:
+    # 동기 HttpPlaceFetcher(urllib3 연결 풀)를 스레드에서 돌리고,
+    # 동시 요청 수 / 초당 요청 수 / 재시도를 asyncio 쪽에서 제어한다.
+    # concurrency / rate는 상한이고, 실제 동시 수와 간격은 throttle(AdaptiveThrottle)이 응답을 보고 조절한다.
+    def __init__(self, fetcher=None, concurrency=4, rate=5.0, burst=None, retries=3,
+                 backoff=0.5, max_backoff=8.0, status_callback=None, metrics=None, throttle=None):
+        self.fetcher = fetcher or HttpPlaceFetcher(pool_size=concurrency)
+        self.concurrency = max(1, int(concurrency))
+        self.rate = rate
+        self.burst = burst
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.status_callback = status_callback or (lambda message: None)
+        self.metrics = metrics or CrawlMetrics()
+        self.throttle = throttle or AdaptiveThrottle(self.concurrency, metrics=self.metrics,
+                                                     status_callback=self.status_callback)
+        self.is_running = True
+
+    def stop(self):
+        self.is_running = False
+
+    async def _call(self, bucket, semaphore, func, *args, stage="http_fetch"):
+        async def attempt():
+            async with semaphore:
+                await self.throttle.acquire_async()
+                outcome = ERROR
+                start = None
+                try:
+                    await bucket.acquire()
+                    start = time.perf_counter()
+                    with self.metrics.time(stage):
+                        result = await asyncio.to_thread(func, *args)
+                    outcome = OK
+                    return result
+                except PlaceFetchError as e:
+                    outcome = fetch_outcome(e)
+                    if isinstance(e, PlaceBlockedError) and hasattr(self.fetcher, "rotate"):
+                        self.fetcher.rotate()
+                    raise
+                finally:
+                    self.throttle.release(outcome, time.perf_counter() - start if start is not None else None, stage)
+
+        def retried(error):
+            self.metrics.count("retries_total", status=getattr(error, "status", None) or "none")
+
+        return await retry_with_backoff(attempt, self.retries, self.backoff, self.max_backoff, is_retryable, retried)
+
+    async def crawl(self, keyword, max_count, journal=None, bounds=None):
+        # 완료되는 순서대로 (index, place_id, row)를 내보내는 비동기 제너레이터
+        # journal이 있으면 이미 수집한 장소는 요청하지 않고 기록된 행을 내보낸다.
+        bucket = TokenBucket(self.rate, self.burst)
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        if journal is not None and journal.harvest_complete:
+            place_ids = journal.place_ids[:max_count]
+        else:
+            place_ids = await self._call(bucket, semaphore, self.fetcher.search_ids, keyword, bounds,
+                                         stage="http_search")
+            place_ids = place_ids[:max_count]
+            if journal is not None:
+                journal.add_ids(place_ids)
+                journal.mark_harvested()
+        self.status_callback(f"[데모 버전] {len(place_ids)}개의 장소를 찾았습니다.")
+
+        async def fetch(index, place_id):
+            # "place": ID를 넘겨받은 뒤 (동시 수 / 속도 제한 대기 포함) 행이 나오기까지 걸린 시간
+            started = time.perf_counter()
+            if not self.is_running:
+                return index, None
+            if journal is not None:
+                row = journal.row(place_id)
+                if row:
+                    return index, row
+            try:
+                row = await self._call(bucket, semaphore, self.fetcher.fetch, place_id)
+                if row:
+                    self.metrics.observe("place", time.perf_counter() - started)
+                    if journal is not None:
+                        journal.record(place_id, row)
+                return index, row
+            except PlaceFetchError as e:
+                self.metrics.count("place_failures_total", source="http")
+                self.status_callback(f"[데모] {str(e)} 수집 실패")
+                return index, None
+
+        tasks = [asyncio.ensure_future(fetch(index, place_id)) for index, place_id in enumerate(place_ids)]
+        try:
+            for future in asyncio.as_completed(tasks):
+                index, row = await future
+                if row:
+                    yield index, place_ids[index], row
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+class AsyncCrawlerThread(threading.Thread):
+    # CrawlerThread와 같은 생성자 / callback / status_callback 규약을 따르는 asyncio 백엔드
+    def __init__(self, keyword, max_count, callback, status_callback, engine=None, exporter=None, journal=None,
+                 bounds=None, events=None, **engine_options):
+        super().__init__()
+        self.keyword = keyword
+        self.max_count = 3  # 데모 버전은 3개 고정
+        self.callback = callback
+        self.status_callback = status_callback
+        self.engine = engine or AsyncCrawlEngine(status_callback=status_callback, **engine_options)
+        self.metrics = self.engine.metrics
+        self.exporter = exporter
+        self.journal = journal
+        self.bounds = bounds
+        self.events = events
+        self.is_running = True
+        self.daemon = True
+
+    def run(self):
+        data = []
+        completed = False
+        if self.events is not None:
+            self.events.started(self.keyword, self.max_count)
+        self.status_callback(f"[데모 버전] '{self.keyword}' 검색을 시작합니다... (최대 3개만 수집)")
+        try:
+            asyncio.run(self._collect(data))
+            completed = self.is_running
+            self.status_callback(f"[데모 버전] 크롤링 완료. 총 {len(data)}개의 정보를 수집했습니다.")
+        except Exception as e:
+            self.status_callback(f"[데모] 크롤링 프로세스 중 오류 발생: {str(e)}")
+        finally:
+            self.status_callback(f"[데모] 처리 속도: {self.metrics.summary_text()}")
+            throttle = self.engine.throttle.report()
+            if throttle["decreases"]:
+                self.status_callback(f"[데모] 속도 조절: 동시 {throttle['concurrency']}개, "
+                                     f"간격 {throttle['interval']}초 (감속 {throttle['decreases']}회, 차단 {throttle['blocks']}회)")
+            if self.journal is not None:
+                if completed:
+                    self.journal.finish()
+                else:
+                    self.journal.close()
+            if self.exporter is not None:
+                self.exporter.flush()
+            self.callback(data)
+
+    async def _collect(self, data):
+        rows = {}
+        async for index, place_id, row in self.engine.crawl(self.keyword, self.max_count, self.journal, self.bounds):
+            rows[index] = row
+            self.metrics.count("places_total")
+            if self.events is not None:
+                self.events.row(row, place_id, self.keyword)
+            # 장소 ID를 같이 넘겨야 분할 검색 / --dedupe에서 ID로 중복을 판단한다.
+            if self.exporter is not None and not self.exporter.append(row, place_id):
+                self.metrics.count("duplicates_total")
+            self.status_callback(f"[데모] ({len(rows)}/3) {row[0]} 정보 수집 완료")
+            if not self.is_running:
+                break
+        data.extend(rows[index] for index in sorted(rows))
+
+    def stop(self):
+        self.is_running = False
+        self.engine.stop()
@@ -0,0 +1,273 @@
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+
+from crawler import CrawlerThread
+from async_engine import AsyncCrawlerThread
+from place_extractor import SELECTOR_GROUPS
+from selector_registry import SelectorRegistry
+from browser_session import BrowserSessionManager, create_chrome_driver, browsers_per_crawl, DEFAULT_DISK_CACHE_DIR
+from place_cache import PlaceCache, DEFAULT_CACHE_PATH
+from exporter import StreamingExporter, ExportError
+from crawl_journal import CrawlJournal, journal_path, safe_filename
+from metrics import CrawlMetrics, Profiler
+from crawl_events import CrawlEventStream, EventLogWriter
+from throttle import AdaptiveThrottle
+from normalize import Deduplicator, merge_files
+from place_fetcher import HttpPlaceFetcher
+from sharding import (BoundingBox, Shard, ShardPlanner, DEFAULT_RESULT_CAP, DEFAULT_MAX_DEPTH,
+                      split_keyword_by_district, run_shards)
+
+# tkinter / 디스플레이 없이 키워드 파일을 한 번에 크롤링하는 배치 CLI
+# 사용법: python batch.py keywords.txt --output-dir out --format xlsx --concurrency 4
+
+_print_lock = threading.Lock()
+
+
+def log(message, quiet=False):
+    if quiet:
+        return
+    with _print_lock:
+        print(message, flush=True)
+
+
+def load_keywords(path):
+    # 한 줄에 검색어 하나, 빈 줄과 '#' 주석은 무시, 중복 제거
+    keywords = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            keyword = line.strip()
+            if keyword and not keyword.startswith('#') and keyword not in keywords:
+                keywords.append(keyword)
+    return keywords
+
+
+def crawl_shard(shard, args, exporter, status, cache=None, registry=None, sessions=None, metrics=None,
+                events=None, throttle=None):
+    # 검색어(또는 분할된 타일/구역) 하나를 크롤링해서 exporter에 행을 쌓는다.
+    # 진행 저널은 분할 단위로 따로 둔다 (다시 실행하면 완료된 장소를 건너뜀)
+    journal = CrawlJournal(journal_path(shard.label, os.path.join(args.output_dir, ".journals")), shard.label)
+    if args.fresh:
+        journal.reset()
+    elif journal.resumable:
+        status(f"이전 실행에서 {len(journal.rows)}개 완료, 이어서 수집합니다.")
+    if shard.place_ids and not journal.harvest_complete:
+        # 타일 분할 때 확인한 장소 ID를 그대로 수집한다. (검색을 다시 하지 않으므로 확인한 범위와 수집 범위가 같다)
+        journal.add_ids(shard.place_ids)
+        journal.mark_harvested()
+    try:
+        if args.backend == "async":
+            crawler = AsyncCrawlerThread(shard.keyword, 3, lambda data: None, status, exporter=exporter,
+                                         journal=journal, bounds=shard.bounds, events=events,
+                                         concurrency=args.workers, metrics=metrics, throttle=throttle)
+        else:
+            crawler = CrawlerThread(shard.keyword, 3, lambda data: None, status,
+                                    workers=args.workers, direct=args.direct, cache=cache,
+                                    registry=registry, exporter=exporter, sessions=sessions,
+                                    journal=journal, metrics=metrics, bounds=shard.bounds, events=events,
+                                    throttle=throttle)
+        # 이미 작업 스레드 안이므로 별도 스레드를 띄우지 않고 바로 실행
+        crawler.run()
+    finally:
+        journal.close()
+
+
+def run_keyword(keyword, args, cache=None, registry=None, sessions=None, metrics=None, dedupe=None, shards=None,
+                events=None, throttle=None):
+    started = time.perf_counter()
+    name = safe_filename(keyword)
+    output_path = os.path.join(args.output_dir, f"{name}.{args.format}")
+    shards = shards or [Shard(keyword)]
+    if len(shards) > 1 and dedupe is None:
+        # 타일/구역끼리 겹치는 장소는 장소 ID로 한 번만 저장
+        dedupe = Deduplicator()
+    exporter = StreamingExporter(os.path.join(args.output_dir, f"{name}.partial.csv"), dedupe=dedupe)
+    result = {"keyword": keyword, "shards": len(shards), "rows": 0, "path": None, "error": None}
+    profiler = None
+
+    def status(message):
+        log(f"[{keyword}] {message}", args.quiet)
+        if events is not None:
+            events.status(message, keyword)
+
+    if args.profile:
+        extension = "html" if args.profile == "pyinstrument" else "prof"
+        profiler = Profiler(args.profile, os.path.join(args.output_dir, "profiles", f"{name}.{extension}"))
+        try:
+            profiler.start()
+        except RuntimeError as e:
+            status(str(e))
+            profiler = None
+
+    try:
+        run_shards(shards, lambda shard: crawl_shard(shard, args, exporter, status, cache, registry, sessions, metrics,
+                                                     events, throttle),
+                   args.shard_concurrency)
+
+        result["rows"] = exporter.rows_written
+        if exporter.rows_written:
+            exporter.export(output_path, title=keyword[:31])
+            exporter.discard()
+            result["path"] = output_path
+        else:
+            exporter.discard()
+            result["error"] = "수집된 데이터 없음"
+    except (OSError, ExportError) as e:
+        exporter.close()
+        result["error"] = str(e)
+    finally:
+        if profiler is not None:
+            result["profile"] = profiler.stop()
+    result["elapsed"] = round(time.perf_counter() - started, 2)
+    return result
+
+
+def plan_shards(keyword, args, bounds=None, throttle=None):
+    # --shard 옵션에 따라 검색어를 구역/타일 목록으로 나눈다.
+    if args.shard == "district":
+        return split_keyword_by_district(keyword, args.city)
+    if args.shard == "grid":
+        fetcher = HttpPlaceFetcher()
+        planner = ShardPlanner(fetcher, cap=args.result_cap, max_depth=args.max_depth, throttle=throttle,
+                               status_callback=lambda message: log(f"[{keyword}] {message}", args.quiet))
+        try:
+            return planner.plan(keyword, bounds) or [Shard(keyword, bounds)]
+        finally:
+            fetcher.close()
+    return [Shard(keyword)]
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="네이버 지도 크롤러 배치 실행 (GUI 없음)")
+    parser.add_argument("keyword_file", help="검색어 목록 파일 (한 줄에 하나)")
+    parser.add_argument("--output-dir", default="output", help="결과 파일을 저장할 폴더")
+    parser.add_argument("--format", choices=["xlsx", "csv", "parquet"], default="xlsx")
+    parser.add_argument("--concurrency", type=int, default=2, help="동시에 처리할 검색어 수")
+    parser.add_argument("--workers", type=int, default=1, help="검색어 하나당 브라우저 수 (async: 동시 요청 수)")
+    parser.add_argument("--backend", choices=["selenium", "async"], default="selenium")
+    parser.add_argument("--direct", action="store_true", help="장소 상세 페이지를 HTTP로 직접 수집")
+    parser.add_argument("--show-browser", action="store_true", help="헤드리스 모드를 끄고 브라우저 창을 띄움")
+    parser.add_argument("--lean", action="store_true", help="이미지/폰트/CSS를 받지 않는 가벼운 브라우저 프로필 사용")
+    parser.add_argument("--cache", default=DEFAULT_CACHE_PATH, help="장소 캐시 파일 경로")
+    parser.add_argument("--no-cache", action="store_true", help="장소 캐시를 사용하지 않음")
+    parser.add_argument("--profile", choices=["cprofile", "pyinstrument"],
+                        help="검색어별 프로파일 결과를 output-dir/profiles에 저장")
+    parser.add_argument("--dedupe", action="store_true",
+                        help="검색어 간 중복 장소를 제거 (먼저 수집한 검색어 파일에만 저장)")
+    parser.add_argument("--merge", metavar="FILE", help="모든 검색어 결과를 중복 제거해 하나의 파일로 합침")
+    parser.add_argument("--shard", choices=["district", "grid"],
+                        help="검색 결과 제한을 넘기 위해 구(district) 또는 지도 타일(grid) 단위로 나눠 검색")
+    parser.add_argument("--city", help="구 단위 분할에 사용할 도시 (기본: 검색어에서 찾음)")
+    parser.add_argument("--bbox", help="타일 분할 범위: 도시 이름 또는 '최소경도,최소위도,최대경도,최대위도'")
+    parser.add_argument("--result-cap", type=int, default=DEFAULT_RESULT_CAP,
+                        help="타일 검색 결과가 이 개수 이상이면 4등분")
+    parser.add_argument("--max-depth", type=int, default=DEFAULT_MAX_DEPTH, help="타일을 나누는 최대 단계")
+    parser.add_argument("--shard-concurrency", type=int, default=2, help="검색어 하나에서 동시에 크롤링할 타일/구역 수")
+    parser.add_argument("--events", metavar="FILE",
+                        help="진행 이벤트(상태 / 수집된 행)를 JSON Lines로 기록 (다른 프로그램에서 실시간으로 읽기용)")
+    parser.add_argument("--min-interval", type=float, default=0.0,
+                        help="요청 사이 최소 간격 (초). 실제 간격과 동시 수는 응답 속도 / 오류 / 차단 신호에 따라 자동 조절")
+    parser.add_argument("--block-pause", type=float, default=30.0, help="차단 신호가 보이면 모든 요청을 멈추는 시간 (초)")
+    parser.add_argument("--fresh", action="store_true", help="이전 실행의 진행 기록을 무시하고 처음부터 수집")
+    parser.add_argument("--quiet", action="store_true", help="진행 메시지를 출력하지 않음")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        keywords = load_keywords(args.keyword_file)
+    except OSError as e:
+        print(f"검색어 파일을 읽을 수 없습니다: {e}", file=sys.stderr)
+        return 2
+    if not keywords:
+        print("검색어가 없습니다.", file=sys.stderr)
+        return 2
+
+    bounds = None
+    if args.shard == "grid":
+        try:
+            bounds = BoundingBox.parse(args.bbox or "")
+        except ValueError as e:
+            print(f"--shard grid에는 올바른 --bbox가 필요합니다: {e}", file=sys.stderr)
+            return 2
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    cache = None if args.no_cache else PlaceCache(args.cache)
+    # 단계별 지연시간 / 셀렉터 적중 / 타임아웃 등을 모든 검색어에 걸쳐 집계
+    metrics = CrawlMetrics()
+    dedupe = Deduplicator() if args.dedupe else None
+    registry = SelectorRegistry(groups=SELECTOR_GROUPS, metrics=metrics)
+    # 검색어마다 브라우저를 새로 띄우지 않고 같은 세션들을 돌려 쓴다.
+    driver_factory = partial(create_chrome_driver, headless=not args.show_browser, lean=args.lean,
+                             disk_cache_dir=DEFAULT_DISK_CACHE_DIR)
+    shard_concurrency = max(1, args.shard_concurrency) if args.shard else 1
+    # 검색어 / 구역마다 검색 브라우저 + 상세 워커를 함께 쓰므로 모두 보관해야 다음 검색어에서 다시 띄우지 않는다.
+    max_requests = max(1, args.concurrency) * shard_concurrency * browsers_per_crawl(max(1, args.workers))
+    sessions = BrowserSessionManager(driver_factory, max_idle=max_requests)
+    # 모든 검색어가 같은 사이트를 향하므로 속도 조절기는 하나를 공유한다. (동시 수 상한 = 전체 브라우저 수)
+    throttle = AdaptiveThrottle(max_requests, min_interval=args.min_interval, block_pause=args.block_pause,
+                                metrics=metrics, status_callback=lambda message: log(message, args.quiet))
+
+    events = None
+    event_writer = None
+    if args.events:
+        events = CrawlEventStream()
+        event_writer = EventLogWriter(events, os.path.join(args.output_dir, args.events))
+        event_writer.start()
+
+    started = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as executor:
+            results = list(executor.map(
+                lambda keyword: run_keyword(keyword, args, cache, registry, sessions, metrics, dedupe,
+                                            plan_shards(keyword, args, bounds, throttle), events, throttle),
+                keywords))
+    finally:
+        sessions.close()
+        if event_writer is not None:
+            event_writer.close()
+    elapsed = time.perf_counter() - started
+
+    failed = [result for result in results if result["error"]]
+    summary = {
+        "keywords": len(results),
+        "succeeded": len(results) - len(failed),
+        "failed": len(failed),
+        "rows": sum(result["rows"] for result in results),
+        "elapsed": round(elapsed, 2),
+        "results": results,
+    }
+    summary["browsers"] = dict(sessions.stats)
+    summary["places_per_minute"] = metrics.places_per_minute()
+    summary["throttle"] = throttle.report()
+    if dedupe is not None:
+        summary["duplicates"] = dedupe.duplicates
+    if args.merge:
+        paths = [result["path"] for result in results if result["path"]]
+        try:
+            summary["merge"] = merge_files(paths, os.path.join(args.output_dir, args.merge))
+        except (OSError, ExportError, ValueError) as e:
+            summary["merge"] = {"error": str(e)}
+    metrics.write_json(os.path.join(args.output_dir, "metrics.json"))
+    metrics.write_prometheus(os.path.join(args.output_dir, "metrics.prom"))
+    if cache is not None:
+        summary["cache"] = cache.stats()
+        cache.close()
+    with open(os.path.join(args.output_dir, "summary.json"), 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+
+    print(f"완료: 검색어 {summary['keywords']}개 중 {summary['succeeded']}개 성공, "
+          f"{summary['failed']}개 실패, 총 {summary['rows']}행, {summary['elapsed']}초")
+    for result in failed:
+        print(f"  실패: {result['keyword']} ({result['error']})")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
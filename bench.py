@@ -0,0 +1,201 @@
+import os
+import sys
+import json
+import time
+import argparse
+import tracemalloc
+from functools import partial
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from fixture_server import FixtureConfig, DEFAULT_RECORDED_DIR, start_fixture_server
+from crawler import CrawlerThread
+from async_engine import AsyncCrawlerThread, AsyncCrawlEngine
+from place_fetcher import HttpPlaceFetcher
+from place_extractor import SELECTOR_GROUPS
+from selector_registry import SelectorRegistry
+from browser_session import BrowserSessionManager, create_chrome_driver
+from metrics import CrawlMetrics
+
+# 저장된 searchIframe / entryIframe 페이지를 로컬 서버로 띄워 크롤러 전체를 반복 실행하고
+# 처리량 / 장소당 지연시간(p50, p95) / 메모리를 측정해 기준값과 비교한다.
+# 사용법: python bench.py --iterations 5 --latency 0.2 --jitter 0.1
+#         python bench.py --save-baseline           (현재 결과를 기준값으로 저장)
+# 종료 코드: 0 통과, 1 기준값 대비 회귀, 2 비교할 기준값 없음
+# 기준값은 실행하는 컴퓨터(브라우저 / CPU)에 따라 달라서 저장소에 넣지 않는다.
+# CI에서는 기준이 되는 커밋에서 먼저 --save-baseline으로 저장한 뒤, 같은 러너에서 변경된 코드를 비교한다.
+
+DEFAULT_BASELINE = os.path.join(DEFAULT_RECORDED_DIR, "bench_baseline.json")
+DEFAULT_TOLERANCE = 0.15    # 기준값보다 15% 이상 나빠지면 실패
+
+
+def percentile(values, q):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def scenario_name(backend, workers, direct, recorded):
+    name = f"{backend}-w{workers}"
+    if direct:
+        name += "-direct"
+    # 비동기 엔진은 합성 /place/* 페이지만 받으므로 저장된 페이지를 써도 recorded로 표시하지 않는다.
+    if recorded and backend == "selenium":
+        name += "-recorded"
+    return name
+
+
+def run_once(base_url, keyword, backend, workers, direct, sessions=None):
+    # 장소당 지연시간은 크롤러가 기록하는 "place" 단계 (ID를 넘겨받은 뒤 행이 나오기까지)를 쓴다.
+    # 행 사이 간격으로 재면 병렬 / HTTP 수집에서 행이 몰려 나올 때 0에 가까워진다.
+    metrics = CrawlMetrics()
+    result = {}
+
+    def on_done(data):
+        result["data"] = data
+
+    if backend == "async":
+        engine = AsyncCrawlEngine(HttpPlaceFetcher(base_url=base_url), concurrency=workers, rate=100, metrics=metrics)
+        crawler = AsyncCrawlerThread(keyword, 3, on_done, lambda message: None, engine=engine)
+    else:
+        fetcher = HttpPlaceFetcher(base_url=base_url) if direct else None
+        crawler = CrawlerThread(keyword, 3, on_done, lambda message: None, base_url=base_url, workers=workers,
+                                fetcher=fetcher, registry=SelectorRegistry(None, SELECTOR_GROUPS),
+                                metrics=metrics, sessions=sessions)
+    started = time.perf_counter()
+    crawler.run()
+    elapsed = time.perf_counter() - started
+    place = metrics.histograms.get("place")
+    return elapsed, list(place.samples) if place else [], len(result.get("data") or [])
+
+
+def run_benchmark(config=None, keyword="테스트", backend="selenium", workers=1, direct=False,
+                  iterations=3, warmup=1):
+    config = config or FixtureConfig()
+    server, base_url = start_fixture_server(config)
+    sessions = None
+    if backend == "selenium":
+        # 브라우저 시작 시간은 첫(워밍업) 실행에서만 든다.
+        sessions = BrowserSessionManager(partial(create_chrome_driver, headless=True), max_idle=workers + 1)
+
+    elapsed_runs = []
+    latencies = []
+    places = 0
+    tracemalloc.start()
+    try:
+        for iteration in range(warmup + iterations):
+            elapsed, run_latencies, count = run_once(base_url, keyword, backend, workers, direct, sessions)
+            if iteration < warmup:
+                tracemalloc.reset_peak()
+                continue
+            elapsed_runs.append(elapsed)
+            latencies.extend(run_latencies)
+            places += count
+        _, python_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        if sessions is not None:
+            sessions.close()
+        server.shutdown()
+
+    total = sum(elapsed_runs)
+    result = {
+        "scenario": scenario_name(backend, workers, direct, bool(config.recorded_dir)),
+        "iterations": iterations,
+        "places": places,
+        "latency": config.page_delay,
+        "jitter": config.jitter,
+        "throughput_per_min": round(places * 60 / total, 2) if total else 0.0,
+        "run_mean": round(total / len(elapsed_runs), 3) if elapsed_runs else None,
+        "place_p50": round(percentile(latencies, 0.5), 3) if latencies else None,
+        "place_p95": round(percentile(latencies, 0.95), 3) if latencies else None,
+        "python_peak_mb": round(python_peak / 1024 / 1024, 2),
+    }
+    if resource is not None:
+        # ru_maxrss는 리눅스에서 KB 단위 (브라우저는 종료된 자식 프로세스로 집계)
+        result["max_rss_mb"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+        result["browser_max_rss_mb"] = round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024, 1)
+    return result
+
+
+def compare(result, baseline, tolerance=DEFAULT_TOLERANCE):
+    # 기준값 대비 나빠진 항목 목록 (비어 있으면 통과)
+    regressions = []
+    if not baseline:
+        return regressions
+    if baseline.get("throughput_per_min") and \
+            result["throughput_per_min"] < baseline["throughput_per_min"] * (1 - tolerance):
+        regressions.append(f"처리량 {baseline['throughput_per_min']} → {result['throughput_per_min']}개/분")
+    for key in ("place_p50", "place_p95", "python_peak_mb"):
+        if baseline.get(key) and result.get(key) is not None and result[key] > baseline[key] * (1 + tolerance):
+            regressions.append(f"{key} {baseline[key]} → {result[key]}")
+    return regressions
+
+
+def load_baselines(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_baseline(path, result):
+    baselines = load_baselines(path)
+    baselines[result["scenario"]] = result
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baselines, f, ensure_ascii=False, indent=2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="오프라인 크롤러 벤치마크 (저장된 페이지 + 로컬 서버)")
+    parser.add_argument("--backend", choices=["selenium", "async"], default="selenium")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--direct", action="store_true", help="HTTP 직접 수집 모드")
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--warmup", type=int, default=1, help="측정에서 제외할 첫 실행 횟수")
+    parser.add_argument("--latency", type=float, default=0.2, help="서버 응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="응답 지연 편차 (±초)")
+    parser.add_argument("--render-delay", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=1, help="지연 편차 난수 시드")
+    parser.add_argument("--synthetic", action="store_true", help="저장된 페이지 대신 합성 페이지 사용")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="기준값 JSON 파일")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준값으로 저장")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--output", help="결과 JSON을 저장할 파일")
+    args = parser.parse_args(argv)
+
+    config = FixtureConfig(page_delay=args.latency, render_delay=args.render_delay, jitter=args.jitter,
+                           seed=args.seed, recorded_dir=None if args.synthetic else DEFAULT_RECORDED_DIR)
+    result = run_benchmark(config, backend=args.backend, workers=args.workers, direct=args.direct,
+                           iterations=args.iterations, warmup=args.warmup)
+
+    if args.save_baseline:
+        save_baseline(args.baseline, result)
+        regressions = []
+    else:
+        baseline = load_baselines(args.baseline).get(result["scenario"])
+        if not baseline:
+            # 비교 대상이 없으면 통과로 보지 않는다. (CI에서 회귀를 놓치지 않도록)
+            print(f"[경고] {args.baseline}에 '{result['scenario']}' 기준값이 없습니다. "
+                  f"--save-baseline으로 먼저 저장하세요.", file=sys.stderr)
+        regressions = compare(result, baseline, args.tolerance)
+        result["baseline"] = baseline and {key: baseline.get(key) for key in
+                                           ("throughput_per_min", "place_p50", "place_p95", "python_peak_mb")}
+        result["regressions"] = regressions
+
+    text = json.dumps(result, ensure_ascii=False, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+    if regressions:
+        return 1
+    return 0 if args.save_baseline or result["baseline"] else 2
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
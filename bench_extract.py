@@ -0,0 +1,72 @@
+import os
+import sys
+import json
+import time
+import argparse
+from collections import Counter
+from pathlib import Path
+
+from readiness import ReadinessWaiter
+from place_extractor import SELECTOR_GROUPS, extract_place_info
+from selector_registry import SelectorRegistry
+from browser_session import create_chrome_driver
+
+# 저장해둔 entryIframe HTML로 장소 1개당 WebDriver 호출 수와 추출 시간을 측정한다.
+# 사용법: python bench_extract.py --iterations 20
+
+DEFAULT_FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "entry_iframe.html")
+
+
+def count_commands(driver):
+    # driver.execute를 감싸 WebDriver 명령(=HTTP 왕복) 수를 센다.
+    counts = Counter()
+    original = driver.execute
+
+    def counting_execute(command, params=None):
+        counts[command] += 1
+        return original(command, params)
+
+    driver.execute = counting_execute
+    return counts
+
+
+def run(html_path=DEFAULT_FIXTURE, iterations=10):
+    driver = create_chrome_driver()
+    try:
+        url = Path(html_path).resolve().as_uri()
+        registry = SelectorRegistry(None, SELECTOR_GROUPS)
+        counts = count_commands(driver)
+        timings = []
+        commands = []
+        row = None
+        for _ in range(iterations):
+            driver.get(url)
+            waiter = ReadinessWaiter(driver)
+            counts.clear()
+            start = time.perf_counter()
+            row = extract_place_info(driver, waiter, registry)
+            timings.append(time.perf_counter() - start)
+            commands.append(sum(counts.values()))
+        timings.sort()
+        return {
+            "iterations": iterations,
+            "row": row,
+            "commands_per_place": max(commands),
+            "mean_ms": round(sum(timings) / len(timings) * 1000, 1),
+            "p50_ms": round(timings[len(timings) // 2] * 1000, 1),
+            "max_ms": round(timings[-1] * 1000, 1),
+        }
+    finally:
+        driver.quit()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="entryIframe 추출 벤치마크")
+    parser.add_argument("--html", default=DEFAULT_FIXTURE, help="저장된 entryIframe HTML 경로")
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.html, args.iterations), ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
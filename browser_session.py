@@ -0,0 +1,160 @@
+import os
+import threading
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+DEFAULT_DISK_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".naver_map_crawler", "chrome_cache")
+
+# 가벼운 프로필에서 막을 리소스 (이미지 / 폰트 / 스타일시트)
+LEAN_BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.css",
+]
+
+
+def build_chrome_options(headless=False, lean=False, disk_cache_dir=None):
+    options = webdriver.ChromeOptions()
+    options.add_argument("--log-level=3")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+    if headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1280,1024")
+    if lean:
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument("--disable-extensions")
+        options.add_argument("--disable-background-networking")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--mute-audio")
+        # searchIframe / entryIframe을 같은 렌더러 프로세스에 두어
+        # 요청 차단(CDP)이 iframe에도 적용되고 프로세스 수(메모리)도 줄어든다.
+        options.add_argument("--disable-features=IsolateOrigins,site-per-process")
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+    if disk_cache_dir:
+        # 여러 브라우저가 같은 디스크 캐시를 써서 정적 리소스를 다시 받지 않는다.
+        options.add_argument(f"--disk-cache-dir={disk_cache_dir}")
+    return options
+
+
+def create_chrome_driver(headless=False, lean=False, disk_cache_dir=None):
+    driver = webdriver.Chrome(options=build_chrome_options(headless, lean, disk_cache_dir))
+    if lean:
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": LEAN_BLOCKED_URLS})
+        except WebDriverException:
+            pass
+    return driver
+
+
+def browsers_per_crawl(workers):
+    # 크롤링 한 번이 동시에 쓰는 브라우저 수 (검색 브라우저 + 상세 워커들)
+    return workers + 1 if workers > 1 else 1
+
+
+def is_healthy(driver):
+    try:
+        return driver.execute_script("return 1") == 1
+    except WebDriverException:
+        return False
+
+
+class BrowserSession:
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+
+    def count_page(self, pages=1):
+        self.pages += pages
+
+
+class BrowserSessionManager:
+    # 크롤링이 끝나도 브라우저를 닫지 않고 보관했다가 다음 크롤링에 다시 내준다.
+    # 꺼낼 때 상태를 확인하고, max_pages 페이지를 넘긴 브라우저는 메모리 증가를 막기 위해 새로 띄운다.
+    def __init__(self, driver_factory=create_chrome_driver, max_pages=200, max_idle=4):
+        self.driver_factory = driver_factory
+        self.max_pages = max_pages
+        self.max_idle = max_idle
+        self.stats = {"created": 0, "reused": 0, "recycled": 0, "unhealthy": 0}
+        self._idle = []
+        self._active = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def _create(self):
+        session = BrowserSession(self.driver_factory())
+        with self._condition:
+            self.stats["created"] += 1
+        return session
+
+    def _quit(self, session):
+        try:
+            session.driver.quit()
+        except Exception:
+            pass
+
+    def acquire(self):
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("세션 관리자가 이미 종료되었습니다.")
+            session = self._idle.pop() if self._idle else None
+            self._active += 1
+
+        try:
+            if session is not None:
+                if is_healthy(session.driver):
+                    with self._condition:
+                        self.stats["reused"] += 1
+                    return session
+                with self._condition:
+                    self.stats["unhealthy"] += 1
+                self._quit(session)
+            return self._create()
+        except Exception:
+            with self._condition:
+                self._active -= 1
+                self._condition.notify()
+            raise
+
+    def release(self, session, broken=False):
+        if session is None:
+            return
+        keep = not broken and (self.max_pages is None or session.pages < self.max_pages)
+        if keep:
+            try:
+                session.driver.switch_to.default_content()
+            except WebDriverException:
+                keep = False
+        with self._condition:
+            self._active -= 1
+            if not broken and not keep:
+                self.stats["recycled"] += 1
+            if keep and not self._closed and len(self._idle) < self.max_idle:
+                self._idle.append(session)
+                session = None
+            self._condition.notify()
+        if session is not None:
+            self._quit(session)
+
+    def prewarm(self, count=1):
+        # 첫 크롤링 전에 미리 브라우저를 띄워둔다.
+        sessions = []
+        try:
+            for _ in range(count):
+                sessions.append(self.acquire())
+        finally:
+            for session in sessions:
+                self.release(session)
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for session in idle:
+            self._quit(session)
@@ -0,0 +1,140 @@
+import json
+import queue
+import threading
+import time
+from collections import namedtuple
+
+# 크롤링 스레드가 GUI / 로그 같은 소비자를 직접 호출하지 않고 이벤트만 넣어두는 통로.
+# 작업 스레드는 큐에 넣고 바로 돌아가므로 화면 갱신을 기다리지 않는다.
+#   started   {"keyword", "total"}           검색 시작 (total: 수집할 최대 개수)
+#   status    {"keyword", "message"}         상태 표시줄 문구
+#   row       {"keyword", "row", "place_id"} 장소 한 개 수집 완료
+#   finished  {"data"}                       크롤링 종료 (수집된 전체 행)
+
+CrawlEvent = namedtuple("CrawlEvent", "kind time data")
+
+
+class CrawlEventStream:
+    # 구독자마다 큐를 하나씩 주므로 GUI와 로그 파일이 같은 이벤트를 각자 읽을 수 있다.
+    def __init__(self):
+        self.dropped = 0
+        self._subscribers = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, maxsize=0):
+        subscriber = queue.Queue(maxsize)
+        with self._lock:
+            self._subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+    def publish(self, kind, **data):
+        event = CrawlEvent(kind, time.time(), data)
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(event)
+            except queue.Full:
+                # 크기 제한이 있는 소비자가 밀려도 크롤러는 멈추지 않는다.
+                with self._lock:
+                    self.dropped += 1
+        return event
+
+    # CrawlerThread의 status_callback / callback 자리에 그대로 넘길 수 있는 함수들
+    def started(self, keyword, total):
+        self.publish("started", keyword=keyword, total=total)
+
+    def status(self, message, keyword=None):
+        self.publish("status", keyword=keyword, message=message)
+
+    def row(self, row, place_id=None, keyword=None):
+        self.publish("row", keyword=keyword, row=list(row), place_id=place_id)
+
+    def finished(self, data):
+        self.publish("finished", data=data)
+
+
+def drain(subscriber, limit=None):
+    # 기다리지 않고 지금 쌓여 있는 이벤트만 꺼낸다. (Tk의 after 콜백에서 사용)
+    events = []
+    while limit is None or len(events) < limit:
+        try:
+            events.append(subscriber.get_nowait())
+        except queue.Empty:
+            break
+    return events
+
+
+class ProgressTracker:
+    # started / row 이벤트로 진행 개수, 분당 처리량, 남은 시간을 계산한다.
+    # 소비자가 이벤트를 늦게 꺼내도 값이 틀어지지 않도록 이벤트에 찍힌 시각을 쓴다.
+    def __init__(self):
+        self.reset()
+
+    def reset(self, total=None, started=None):
+        self.total = total
+        self.count = 0
+        self.started = started or time.time()
+        self.last = self.started
+
+    def update(self, event):
+        if event.kind == "started":
+            self.reset(event.data.get("total"), event.time)
+        elif event.kind == "row":
+            self.count += 1
+            self.last = event.time
+
+    def per_minute(self):
+        elapsed = self.last - self.started
+        return self.count * 60 / elapsed if elapsed > 0 else 0.0
+
+    def eta(self):
+        # 남은 시간 (초). 아직 수집된 행이 없으면 None
+        if not self.total or not self.count:
+            return None
+        elapsed = self.last - self.started
+        return max(0.0, (self.total - self.count) * elapsed / self.count - (time.time() - self.last))
+
+    def text(self):
+        parts = [f"수집 {self.count}/{self.total}" if self.total else f"수집 {self.count}개",
+                 f"분당 {self.per_minute():.1f}개"]
+        eta = self.eta()
+        if eta is not None and self.count < (self.total or 0):
+            parts.append(f"남은 시간 약 {int(eta + 0.5)}초")
+        return " · ".join(parts)
+
+
+class EventLogWriter(threading.Thread):
+    # GUI가 없는 소비자 예시: 이벤트를 한 줄에 하나씩 JSON으로 기록 (batch.py --events)
+    def __init__(self, stream, path):
+        super().__init__()
+        self.stream = stream
+        self.path = path
+        self.subscriber = stream.subscribe()
+        self._stopped = threading.Event()
+        self.daemon = True
+
+    def run(self):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            while not (self._stopped.is_set() and self.subscriber.empty()):
+                try:
+                    event = self.subscriber.get(timeout=0.2)
+                except queue.Empty:
+                    continue
+                data = dict(event.data)
+                if event.kind == "finished":
+                    # 전체 행은 row 이벤트로 이미 기록했으므로 개수만 남긴다.
+                    data = {"count": len(data.get("data") or [])}
+                f.write(json.dumps({"kind": event.kind, "time": round(event.time, 3), **data},
+                                   ensure_ascii=False) + "\n")
+                f.flush()
+
+    def close(self):
+        self._stopped.set()
+        self.join()
+        self.stream.unsubscribe(self.subscriber)
@@ -0,0 +1,140 @@
+import os
+import re
+import json
+import hashlib
+import threading
+
+DEFAULT_JOURNAL_DIR = os.path.join(os.path.expanduser("~"), ".naver_map_crawler", "journals")
+
+_UNSAFE_FILENAME = re.compile(r'[\\/:*?"<>|\s]+')
+
+
+def safe_filename(keyword):
+    # 검색어를 파일 이름으로 쓸 수 있게 바꾼다. (결과 파일 / 저널 파일 공용)
+    return _UNSAFE_FILENAME.sub('_', keyword).strip('_') or "keyword"
+
+
+def journal_path(keyword, directory=DEFAULT_JOURNAL_DIR):
+    # 같은 검색어는 항상 같은 저널 파일을 쓴다 (비슷한 이름끼리 겹치지 않도록 해시를 붙임)
+    name = safe_filename(keyword)[:40]
+    digest = hashlib.sha1(keyword.encode('utf-8')).hexdigest()[:8]
+    return os.path.join(directory, f"{name}-{digest}.jsonl")
+
+
+class CrawlJournal:
+    # 크롤링 진행 상황을 JSONL 파일에 한 줄씩 덧붙여 기록한다.
+    #   {"keyword": ...}              첫 줄 (다른 검색어의 저널이면 새로 시작)
+    #   {"ids": [...]}                목록에서 찾은 장소 ID
+    #   {"harvested": true}           목록 수집이 끝까지 완료됨
+    #   {"id": ..., "row": [...]}     상세 정보 수집 완료
+    # 프로그램이 죽거나 중지돼도 같은 검색어로 다시 실행하면 완료된 장소는 건너뛰고 이어서 수집한다.
+    # 크롤링이 정상 종료되면 finish()로 저널을 지운다.
+    def __init__(self, path, keyword=None):
+        self.path = path
+        self.keyword = keyword
+        self.place_ids = []
+        self.rows = {}
+        self.harvest_complete = False
+        self._known = set()
+        self._lock = threading.Lock()
+        self._file = None
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        if not self._load():
+            self.reset()
+        else:
+            self._file = open(path, 'a', encoding='utf-8')
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return False
+        with open(self.path, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        if not lines:
+            return False
+        for number, line in enumerate(lines):
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # 기록 도중 죽어서 잘린 마지막 줄은 버린다.
+                continue
+            if number == 0:
+                if self.keyword is not None and entry.get("keyword") != self.keyword:
+                    return False
+                continue
+            if "ids" in entry:
+                self._add_ids(entry["ids"])
+            elif "row" in entry:
+                self._add_ids([entry["id"]])
+                self.rows[entry["id"]] = entry["row"]
+            elif entry.get("harvested"):
+                self.harvest_complete = True
+        return True
+
+    def _add_ids(self, place_ids):
+        added = []
+        for place_id in place_ids:
+            if place_id and place_id not in self._known:
+                self._known.add(place_id)
+                self.place_ids.append(place_id)
+                added.append(place_id)
+        return added
+
+    def _write(self, entry):
+        if self._file is None:
+            return
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    @property
+    def resumable(self):
+        return bool(self.rows or self.place_ids)
+
+    def row(self, place_id):
+        with self._lock:
+            row = self.rows.get(place_id)
+            return list(row) if row is not None else None
+
+    def add_ids(self, place_ids):
+        with self._lock:
+            added = self._add_ids(place_ids)
+            if added:
+                self._write({"ids": added})
+
+    def mark_harvested(self):
+        with self._lock:
+            if not self.harvest_complete:
+                self.harvest_complete = True
+                self._write({"harvested": True})
+
+    def record(self, place_id, row):
+        if not place_id:
+            return
+        with self._lock:
+            if self.rows.get(place_id) == list(row):
+                return
+            self._add_ids([place_id])
+            self.rows[place_id] = list(row)
+            self._write({"id": place_id, "row": list(row)})
+
+    def reset(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+            self.place_ids = []
+            self.rows = {}
+            self.harvest_complete = False
+            self._known = set()
+            self._file = open(self.path, 'w', encoding='utf-8')
+            self._write({"keyword": self.keyword})
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def finish(self):
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
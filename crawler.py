@@ -0,0 +1,521 @@
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+from urllib.parse import quote
+from readiness import ReadinessWaiter
+from place_extractor import SELECTOR_GROUPS, element_place_id, open_place_entry, extract_place_info
+from selector_registry import SelectorRegistry
+from harvester import ResultHarvester
+from place_fetcher import HttpPlaceFetcher, PlaceFetchError, PlaceBlockedError, fetch_outcome
+from worker_pool import BrowserWorkerPool
+from browser_session import BrowserSessionManager, create_chrome_driver
+from exporter import ExportError
+from metrics import CrawlMetrics
+from throttle import AdaptiveThrottle, BlockedError, OK, ERROR, TIMEOUT, BLOCKED
+
+# tkinter 없이 import 가능한 크롤링 엔진 (GUI와 배치 CLI가 함께 사용)
+
+class CrawlerThread(threading.Thread):
+    def __init__(self, keyword, max_count, callback, status_callback, timeouts=None, base_url="https://map.naver.com",
+                 workers=1, direct=False, fetcher=None, cache=None, registry=None, exporter=None,
+                 driver_factory=create_chrome_driver, sessions=None, journal=None, metrics=None, bounds=None,
+                 events=None, throttle=None):
+        super().__init__()
+        self.keyword = keyword
+        self.max_count = 3  # 데모 버전은 3개 고정
+        self.callback = callback
+        self.status_callback = status_callback
+        self.timeouts = timeouts
+        self.base_url = base_url.rstrip('/')
+        self.workers = max(1, int(workers))
+        self.direct = direct or fetcher is not None
+        self.fetcher = fetcher
+        self.cache = cache
+        self.metrics = metrics or CrawlMetrics()
+        self.registry = registry or SelectorRegistry(groups=SELECTOR_GROUPS, metrics=self.metrics)
+        self.exporter = exporter
+        self.driver_factory = driver_factory
+        self.sessions = sessions
+        self.session = None
+        self.journal = journal
+        self.bounds = bounds
+        self.events = events
+        # 여러 크롤러가 같은 사이트를 향하면 하나의 throttle을 공유해야 전체 속도가 조절된다.
+        self.throttle = throttle or AdaptiveThrottle(self.workers, metrics=self.metrics,
+                                                     status_callback=self.status_callback)
+        self.pool = None
+        self.place_ids = {}
+        self.place_started = {}     # 장소 ID → 상세 수집을 시작한 시각 (장소당 지연시간 "place" 단계)
+        self.is_running = True
+        self.daemon = True
+
+    def run(self):
+        data = []
+        if self.events is not None:
+            self.events.started(self.keyword, self.max_count)
+        self.status_callback(f"[데모 버전] '{self.keyword}' 검색을 시작합니다... (최대 3개만 수집)")
+        driver = None
+        waiter = None
+        broken = False
+        completed = False
+        # 세션 관리자가 없으면 이번 크롤링에서만 쓰고 닫는다.
+        sessions = self.sessions or BrowserSessionManager(self.driver_factory, max_idle=0)
+        
+        try:
+            self.session = sessions.acquire()
+            driver = self.session.driver
+            waiter = ReadinessWaiter(driver, self.timeouts, metrics=self.metrics)
+            
+            # 이전 실행에서 목록 수집을 끝냈다면 검색 페이지를 다시 스크롤하지 않고 저장된 ID로 이어서 수집
+            if self.journal is not None and self.journal.harvest_complete:
+                place_ids = self.journal.place_ids[:self.max_count]
+                self.status_callback(f"[데모 버전] 이전 작업을 이어서 수집합니다. "
+                                     f"({len(self.journal.rows)}/{len(place_ids)}개 완료)")
+                data.extend(self.collect_by_ids(driver, waiter, place_ids))
+                completed = self.is_running
+                self.status_callback(f"[데모 버전] 크롤링 완료. 총 {len(data)}개의 정보를 수집했습니다.")
+                return
+            
+            # URL 기반으로 직접 검색
+            encoded_keyword = quote(self.keyword)
+            search_url = f"{self.base_url}/p/search/{encoded_keyword}"
+            if self.bounds is not None:
+                # 지도 범위(타일)를 지정한 검색
+                search_url += f"?c={self.bounds.map_param()}"
+            opened = self.open_search(sessions, waiter, search_url)
+            if opened is None:
+                return
+            waiter = opened
+            driver = waiter.driver
+
+            self.status_callback("[데모 버전] 검색 결과를 불러오는 중...")
+
+            # 장소 링크 찾기 (학습된 순서대로 시도)
+            place_elements = []
+            selectors = self.registry.ranked("place_list")
+
+            # 목록이 렌더링될 때까지 대기
+            try:
+                waiter.selector("search_list", selectors)
+            except TimeoutException:
+                pass
+
+            # 목록을 스크롤하며 장소 ID를 모으고, 모이는 대로 상세 페이지를 직접 수집
+            # (브라우저 하나로 순차 수집할 때는 목록 수집이 끝난 뒤 ID로 상세 페이지를 연다)
+            harvester = ResultHarvester(driver, waiter, self.max_count)
+            data.extend(self.collect_by_ids(driver, waiter, harvester))
+            if harvester.seen:
+                completed = self.is_running
+                self.status_callback(f"[데모 버전] 크롤링 완료. 총 {len(data)}개의 정보를 수집했습니다.")
+                return
+            # 장소 ID를 읽을 수 없는 목록이면 예전처럼 항목을 하나씩 클릭해서 수집
+            self.status_callback("[데모 버전] 장소 ID를 찾지 못해 순차 수집으로 진행합니다.")
+            # 순번으로 다시 찾아 클릭하므로 목록 렌더링(스크롤로 추가된 항목 포함)이 멈춘 뒤에 요소를 고정한다.
+            try:
+                waiter.dom_stable()
+            except TimeoutException:
+                pass
+            
+            for selector in selectors:
+                try:
+                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
+                    if elements:
+                        self.status_callback(f"[데모 버전] {len(elements)}개의 요소를 찾았습니다.")
+                        if selector == "span.YwYLL":
+                            place_elements = []
+                            for elem in elements:
+                                try:
+                                    parent = elem.find_element(By.XPATH, "./ancestor::a[@role='button']")
+                                    place_elements.append(parent)
+                                except:
+                                    try:
+                                        parent = elem.find_element(By.XPATH, "./ancestor::a")
+                                        place_elements.append(parent)
+                                    except:
+                                        pass
+                        else:
+                            place_elements = elements
+                        self.registry.record("place_list", selector, True)
+                        break
+                    self.registry.record("place_list", selector, False)
+                except NoSuchElementException:
+                    continue
+            
+            if not place_elements:
+                self.status_callback("[데모 버전] 클릭 가능한 장소를 찾을 수 없습니다.")
+                self.callback(data)
+                return
+
+            # 최대 3개만 처리
+            total_to_process = min(len(place_elements), 3)
+            self.status_callback(f"[데모 버전] 3개의 정보만 수집합니다.")
+
+            # 각 장소 클릭하여 정보 추출
+            collected_count = 0
+            for i in range(total_to_process):
+                if not self.is_running or not self.throttle.acquire(lambda: not self.is_running):
+                    break
+                outcome = ERROR
+                started = time.perf_counter()
+                
+                try:
+                    # 매번 요소 다시 찾기
+                    driver.switch_to.default_content()
+                    previous_entry_src = waiter.entry_src()
+                    waiter.frame("return_search", "searchIframe")
+                    
+                    # 현재 인덱스의 요소 다시 찾기
+                    current_elements = []
+                    for selector in selectors:
+                        try:
+                            elements = driver.find_elements(By.CSS_SELECTOR, selector)
+                            if elements and len(elements) > i:
+                                if selector == "span.YwYLL":
+                                    try:
+                                        parent = elements[i].find_element(By.XPATH, "./ancestor::a[@role='button']")
+                                        current_elements = [parent]
+                                    except:
+                                        try:
+                                            parent = elements[i].find_element(By.XPATH, "./ancestor::a")
+                                            current_elements = [parent]
+                                        except:
+                                            continue
+                                else:
+                                    current_elements = [elements[i]]
+                                break
+                        except:
+                            continue
+                    
+                    if not current_elements:
+                        outcome = None
+                        continue
+                    
+                    element = current_elements[0]
+                    
+                    # 캐시에 있는 장소는 클릭하지 않고 바로 사용
+                    place_id = element_place_id(driver, element)
+                    cached = self.cached_row(place_id)
+                    if cached:
+                        outcome = None
+                        data.append(cached)
+                        self.emit(cached, place_id)
+                        collected_count += 1
+                        self.status_callback(f"[데모] ({collected_count}/3) {cached[0]} 캐시에서 불러옴")
+                        if collected_count >= 3:
+                            self.status_callback(f"[데모 버전] 3개 수집 완료. 더 많은 정보는 정식 버전에서!")
+                            break
+                        continue
+                    
+                    # 스크롤
+                    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+                    
+                    # 클릭
+                    click_start = time.perf_counter()
+                    try:
+                        driver.execute_script("arguments[0].click();", element)
+                    except:
+                        try:
+                            element.click()
+                        except:
+                            self.metrics.count("click_failures_total")
+                            continue
+                    finally:
+                        self.metrics.observe("click", time.perf_counter() - click_start)
+                    
+                    # entryIframe으로 전환
+                    driver.switch_to.default_content()
+                    
+                    try:
+                        # 클릭으로 entryIframe 주소가 바뀔 때까지 대기
+                        waiter.entry_url_change(previous_entry_src)
+                        waiter.frame("entry_frame", "entryIframe")
+                        self.session.count_page()
+                        
+                        # 정보 추출
+                        with self.metrics.time("extract"):
+                            row = extract_place_info(driver, waiter, self.registry)
+                        outcome = OK
+                        if row:
+                            self.store_row(place_id, row)
+                            data.append(row)
+                            self.place_started[place_id] = started
+                            self.emit(row, place_id)
+                            collected_count += 1
+                            self.status_callback(f"[데모] ({collected_count}/3) {row[0]} 정보 수집 완료")
+                            
+                            if collected_count >= 3:
+                                self.status_callback(f"[데모 버전] 3개 수집 완료. 더 많은 정보는 정식 버전에서!")
+                                break
+                        
+                    except TimeoutException:
+                        outcome = BLOCKED if waiter.block_signal() else TIMEOUT
+                        self.metrics.count("place_failures_total", source="browser")
+                        self.status_callback(f"[데모] ({i + 1}/3번째 항목에서 상세 정보를 찾을 수 없음)")
+                    except Exception as e:
+                        self.metrics.count("place_failures_total", source="browser")
+                        self.status_callback(f"[데모] ({i + 1}/3번째 항목 처리 중 오류: {str(e)}")
+                    
+                except Exception as e:
+                    self.status_callback(f"[데모] 항목 처리 중 오류: {str(e)}")
+                    continue
+                finally:
+                    self.throttle.release(outcome, time.perf_counter() - started, "place_page")
+
+            completed = self.is_running
+            self.status_callback(f"[데모 버전] 크롤링 완료. 총 {collected_count}개의 정보를 수집했습니다.")
+
+        except Exception as e:
+            # 차단된 브라우저는 쿠키 / 세션째 버리고 다음 검색에서 새로 띄운다.
+            broken = isinstance(e, (WebDriverException, BlockedError))
+            self.status_callback(f"[데모] 크롤링 프로세스 중 오류 발생: {str(e)}")
+        finally:
+            if waiter is not None:
+                # 대기 / 추출 시간은 검색 브라우저와 병렬 워커 모두 self.metrics에 모인다.
+                self.status_callback(f"[데모] 처리 속도: {self.metrics.summary_text()}")
+                throttle = self.throttle.report()
+                if throttle["decreases"]:
+                    self.status_callback(f"[데모] 속도 조절: 동시 {throttle['concurrency']}개, 간격 {throttle['interval']}초 "
+                                         f"(감속 {throttle['decreases']}회, 차단 {throttle['blocks']}회)")
+            try:
+                self.registry.save()
+            except OSError:
+                pass
+            if self.cache is not None:
+                stats = self.cache.stats()
+                self.status_callback(f"[데모] 캐시 적중 {stats['hits']}회 / 미스 {stats['misses']}회 (저장 {stats['size']}개)")
+            if self.session is not None:
+                sessions.release(self.session, broken=broken)
+                self.session = None
+            if self.sessions is None:
+                sessions.close()
+            if self.journal is not None:
+                if completed:
+                    self.journal.finish()
+                else:
+                    self.journal.close()
+                    self.status_callback(f"[데모] 진행 상황을 저장했습니다. 다시 실행하면 이어서 수집합니다. "
+                                         f"({len(self.journal.rows)}개 완료)")
+            if self.exporter is not None:
+                self.exporter.flush()
+            self.callback(data)
+
+    def open_search(self, sessions, waiter, search_url, retries=1):
+        # 검색 페이지를 열고 searchIframe으로 전환한다. (성공하면 사용한 waiter, 중지되면 None)
+        # 차단 페이지가 열리면 브라우저를 교체하고, throttle의 대기 시간이 지난 뒤 다시 시도한다.
+        for attempt in range(retries + 1):
+            if not self.throttle.acquire(lambda: not self.is_running):
+                return None
+            outcome = ERROR
+            started = time.perf_counter()
+            try:
+                with self.metrics.time("search_page"):
+                    waiter.driver.get(search_url)
+                self.session.count_page()
+
+                # searchIframe으로 전환 (고정 대기 대신 실제 로딩 신호 대기)
+                waiter.frame("search_frame", "searchIframe")
+                outcome = OK
+                return waiter
+            except TimeoutException:
+                # searchIframe이 없으면 캡차 / 접근 제한 페이지일 수 있다.
+                signal = waiter.block_signal("searchIframe")
+                if not signal:
+                    outcome = TIMEOUT
+                    raise
+                outcome = BLOCKED
+            finally:
+                self.throttle.release(outcome, time.perf_counter() - started, "search_page")
+
+            if attempt >= retries:
+                raise BlockedError(f"검색 페이지가 계속 차단되어 크롤링을 중단합니다 ({signal}).")
+            self.status_callback(f"[데모] 검색 페이지 차단 신호({signal}), 잠시 쉬었다가 새 브라우저로 다시 검색합니다.")
+            sessions.release(self.session, broken=True)
+            self.session = None
+            self.session = sessions.acquire()
+            waiter = ReadinessWaiter(self.session.driver, self.timeouts, metrics=self.metrics)
+        return None
+
+    def collect_by_ids(self, driver, waiter, place_ids):
+        # place_ids는 스크롤 수집기처럼 점진적으로 ID를 내주는 iterable일 수 있다.
+        # 목록 수집과 상세 수집이 겹치도록 ID가 나오는 즉시 상세 단계로 넘긴다.
+        rows = {}
+        pending = []
+        fetches = {}
+        executor = None
+        
+        if self.direct:
+            # 1차: HTTP로 상세 페이지 JSON 파싱 (브라우저 이동 없음)
+            if self.fetcher is None:
+                self.fetcher = HttpPlaceFetcher()
+            executor = ThreadPoolExecutor(max_workers=self.workers)
+        elif self.workers > 1:
+            self.start_pool()
+        
+        try:
+            for index, place_id in enumerate(place_ids):
+                if not self.is_running:
+                    break
+                self.place_ids[index] = place_id
+                if self.journal is not None:
+                    self.journal.add_ids([place_id])
+                cached = self.cached_row(place_id)
+                if cached:
+                    rows[index] = cached
+                    self.emit(cached, place_id)
+                    self.status_callback(f"[데모] ({len(rows)}/{self.max_count}) {cached[0]} 캐시에서 불러옴")
+                    continue
+                self.place_started[place_id] = time.perf_counter()
+                if executor is not None:
+                    fetches[executor.submit(self.fetch_http, place_id)] = (index, place_id)
+                elif self.pool is not None:
+                    if not self.pool.submit(index, place_id):
+                        break
+                else:
+                    pending.append((index, place_id))
+            else:
+                # ID를 하나도 못 찾았으면 클릭 수집으로 넘어가므로 목록 수집 완료로 기록하지 않는다.
+                if self.journal is not None and self.is_running and self.place_ids:
+                    self.journal.mark_harvested()
+            
+            for future in as_completed(fetches):
+                index, place_id = fetches[future]
+                row = future.result()
+                if row:
+                    self.store_row(place_id, row)
+                    rows[index] = row
+                    self.emit(row, place_id)
+                    self.status_callback(f"[데모] ({len(rows)}/{self.max_count}) {row[0]} 정보 수집 완료")
+                else:
+                    pending.append((index, place_id))
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+        
+        # 2차: 남은 장소는 Selenium으로 상세 페이지를 직접 열어 추출
+        if pending and self.is_running:
+            if self.workers > 1:
+                if self.pool is None:
+                    self.start_pool()
+                for index, place_id in sorted(pending):
+                    if not self.is_running or not self.pool.submit(index, place_id):
+                        break
+            else:
+                for index, place_id in sorted(pending):
+                    if not self.is_running or not self.throttle.acquire(lambda: not self.is_running):
+                        break
+                    outcome = ERROR
+                    started = time.perf_counter()
+                    try:
+                        open_place_entry(driver, waiter, self.base_url, place_id)
+                        self.session.count_page()
+                        with self.metrics.time("extract"):
+                            row = extract_place_info(driver, waiter, self.registry)
+                        outcome = OK
+                    except TimeoutException:
+                        outcome = BLOCKED if waiter.block_signal() else TIMEOUT
+                        self.metrics.count("place_failures_total", source="browser")
+                        self.status_callback(f"[데모] {place_id} 상세 정보를 찾을 수 없음")
+                        continue
+                    except Exception as e:
+                        self.metrics.count("place_failures_total", source="browser")
+                        self.status_callback(f"[데모] {place_id} 처리 중 오류: {str(e)}")
+                        continue
+                    finally:
+                        self.throttle.release(outcome, time.perf_counter() - started, "place_page")
+                    if row:
+                        self.store_row(place_id, row)
+                        rows[index] = row
+                        self.emit(row, place_id)
+                        self.status_callback(f"[데모] ({len(rows)}/{self.max_count}) {row[0]} 정보 수집 완료")
+        
+        if self.pool is not None:
+            self.pool.close()
+            rows.update(self.pool.results)
+        
+        return [rows[index] for index in sorted(rows)]
+
+    def emit(self, row, place_id=None):
+        # 수집되는 즉시 스트리밍 저장
+        self.metrics.count("places_total")
+        started = self.place_started.pop(place_id, None)
+        if started is not None:
+            self.metrics.observe("place", time.perf_counter() - started)
+        if self.events is not None:
+            self.events.row(row, place_id, self.keyword)
+        if self.exporter is None:
+            return
+        try:
+            if not self.exporter.append(row, place_id):
+                self.metrics.count("duplicates_total")
+        except (OSError, ExportError) as e:
+            self.status_callback(f"[데모] 중간 저장 실패: {str(e)}")
+
+    def cached_row(self, place_id):
+        if not place_id:
+            return None
+        if self.journal is not None:
+            row = self.journal.row(place_id)
+            if row:
+                self.metrics.count("journal_hits_total")
+                return row
+        if self.cache is None:
+            return None
+        row = self.cache.get(place_id)
+        self.metrics.count("cache_hits_total" if row else "cache_misses_total")
+        if row and self.journal is not None:
+            self.journal.record(place_id, row)
+        return row
+
+    def store_row(self, place_id, row):
+        if self.journal is not None and place_id:
+            self.journal.record(place_id, row)
+        if self.cache is not None and place_id:
+            self.cache.put(place_id, row)
+
+    def pool_row(self, index, row):
+        # 병렬 수집은 pool.close() 전에 죽을 수 있으므로 행이 나오는 즉시 저널 / 캐시에 남긴다.
+        place_id = self.place_ids.get(index)
+        self.store_row(place_id, row)
+        self.emit(row, place_id)
+
+    def fetch_http(self, place_id):
+        if not self.throttle.acquire(lambda: not self.is_running):
+            return None
+        outcome = ERROR
+        started = time.perf_counter()
+        try:
+            with self.metrics.time("http_fetch"):
+                row = self.fetcher.fetch(place_id)
+            outcome = OK
+            return row
+        except PlaceFetchError as e:
+            outcome = fetch_outcome(e)
+            if isinstance(e, PlaceBlockedError):
+                self.fetcher.rotate()
+            self.metrics.count("http_fallbacks_total", status=e.status or "none")
+            self.status_callback(f"[데모] HTTP 수집 실패, 브라우저로 재시도: {str(e)}")
+            return None
+        finally:
+            self.throttle.release(outcome, time.perf_counter() - started, "http_fetch")
+
+    def start_pool(self):
+        self.status_callback(f"[데모 버전] 브라우저 {self.workers}개로 상세 정보를 수집합니다.")
+        self.pool = BrowserWorkerPool(
+            self.workers,
+            base_url=self.base_url,
+            status_callback=self.status_callback,
+            driver_factory=self.driver_factory,
+            sessions=self.sessions,
+            timeouts=self.timeouts,
+            registry=self.registry,
+            row_callback=self.pool_row,
+            metrics=self.metrics,
+            throttle=self.throttle,
+        ).start()
+
+    def stop(self):
+        self.is_running = False
+        if self.pool is not None:
+            self.pool.stop()
@@ -1,276 +1,34 @@
+import os
 import sys
 import time
+import argparse
+import threading
+from functools import partial
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import threading
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from selenium.webdriver.common.action_chains import ActionChains
-import openpyxl
-import re
-from urllib.parse import quote
-
-class CrawlerThread(threading.Thread):
-    def __init__(self, keyword, max_count, callback, status_callback):
-        super().__init__()
-        self.keyword = keyword
-        self.max_count = 3  # 데모 버전은 3개 고정
-        self.callback = callback
-        self.status_callback = status_callback
-        self.is_running = True
-        self.daemon = True
-
-    def run(self):
-        data = []
-        self.status_callback(f"[데모 버전] '{self.keyword}' 검색을 시작합니다... (최대 3개만 수집)")
-        driver = None
-        
-        try:
-            options = webdriver.ChromeOptions()
-            options.add_argument("--log-level=3")
-            options.add_argument("--disable-blink-features=AutomationControlled")
-            options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            options.add_experimental_option('useAutomationExtension', False)
-            driver = webdriver.Chrome(options=options)
-            
-            # URL 기반으로 직접 검색
-            encoded_keyword = quote(self.keyword)
-            search_url = f"https://map.naver.com/p/search/{encoded_keyword}"
-            driver.get(search_url)
-            
-            time.sleep(3)
-
-            # searchIframe으로 전환
-            WebDriverWait(driver, 20).until(EC.frame_to_be_available_and_switch_to_it((By.ID, "searchIframe")))
-            time.sleep(2)
-
-            # 스크롤 최소화 (데모 버전)
-            self.status_callback("[데모 버전] 검색 결과를 불러오는 중...")
-            time.sleep(2)
-
-            # 장소 링크 찾기
-            place_elements = []
-            selectors = [
-                "a.place_bluelink",
-                "a[class*='place_bluelink']",
-                ".place_bluelink",
-                "span.YwYLL",
-                "a[role='button']",
-                ".VLTHu.OW9LQ"
-            ]
-            
-            for selector in selectors:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        self.status_callback(f"[데모 버전] {len(elements)}개의 요소를 찾았습니다.")
-                        if selector == "span.YwYLL":
-                            place_elements = []
-                            for elem in elements:
-                                try:
-                                    parent = elem.find_element(By.XPATH, "./ancestor::a[@role='button']")
-                                    place_elements.append(parent)
-                                except:
-                                    try:
-                                        parent = elem.find_element(By.XPATH, "./ancestor::a")
-                                        place_elements.append(parent)
-                                    except:
-                                        pass
-                        else:
-                            place_elements = elements
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            if not place_elements:
-                self.status_callback("[데모 버전] 클릭 가능한 장소를 찾을 수 없습니다.")
-                self.callback(data)
-                return
-
-            # 최대 3개만 처리
-            total_to_process = min(len(place_elements), 3)
-            self.status_callback(f"[데모 버전] 3개의 정보만 수집합니다.")
-
-            # 각 장소 클릭하여 정보 추출
-            collected_count = 0
-            for i in range(total_to_process):
-                if not self.is_running:
-                    break
-                
-                try:
-                    # 매번 요소 다시 찾기
-                    driver.switch_to.default_content()
-                    WebDriverWait(driver, 10).until(EC.frame_to_be_available_and_switch_to_it((By.ID, "searchIframe")))
-                    time.sleep(1)
-                    
-                    # 현재 인덱스의 요소 다시 찾기
-                    current_elements = []
-                    for selector in selectors:
-                        try:
-                            elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                            if elements and len(elements) > i:
-                                if selector == "span.YwYLL":
-                                    try:
-                                        parent = elements[i].find_element(By.XPATH, "./ancestor::a[@role='button']")
-                                        current_elements = [parent]
-                                    except:
-                                        try:
-                                            parent = elements[i].find_element(By.XPATH, "./ancestor::a")
-                                            current_elements = [parent]
-                                        except:
-                                            continue
-                                else:
-                                    current_elements = [elements[i]]
-                                break
-                        except:
-                            continue
-                    
-                    if not current_elements:
-                        continue
-                    
-                    element = current_elements[0]
-                    
-                    # 스크롤
-                    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                    time.sleep(1)
-                    
-                    # 클릭
-                    try:
-                        driver.execute_script("arguments[0].click();", element)
-                    except:
-                        try:
-                            element.click()
-                        except:
-                            continue
-                    
-                    time.sleep(2)
-                    
-                    # entryIframe으로 전환
-                    driver.switch_to.default_content()
-                    
-                    try:
-                        WebDriverWait(driver, 5).until(EC.frame_to_be_available_and_switch_to_it((By.ID, "entryIframe")))
-                        time.sleep(1)
-                        
-                        # 정보 추출
-                        name = "정보 없음"
-                        road_address = "정보 없음"
-                        jibun_address = "정보 없음"
-                        phone = "정보 없음"
-                        
-                        # 이름 추출
-                        name_selectors = [".YwYLL", ".GHAhO", "span.YwYLL", "h2.YwYLL"]
-                        for sel in name_selectors:
-                            try:
-                                name_elem = WebDriverWait(driver, 3).until(
-                                    EC.presence_of_element_located((By.CSS_SELECTOR, sel))
-                                )
-                                name = name_elem.text.strip()
-                                name = name.replace('복사', '').strip()
-                                if name:
-                                    break
-                            except:
-                                continue
-                        
-                        # 주소 추출
-                        try:
-                            address_button = driver.find_element(By.CSS_SELECTOR, "a.PkgBl")
-                            driver.execute_script("arguments[0].click();", address_button)
-                            time.sleep(1)
-                            
-                            address_divs = driver.find_elements(By.CSS_SELECTOR, "div.nQ7Lh")
-                            for div in address_divs:
-                                try:
-                                    address_text = div.text.strip()
-                                    address_text = address_text.replace('복사', '').replace('도로명', '').replace('지번', '').strip()
-                                    
-                                    if ('로' in address_text or '길' in address_text) and road_address == "정보 없음":
-                                        road_address = address_text
-                                    elif ('동' in address_text or '리' in address_text or re.search(r'\d+-\d+', address_text)) and jibun_address == "정보 없음":
-                                        jibun_address = address_text
-                                except:
-                                    continue
-                        except:
-                            pass
-                        
-                        # 전화번호 추출
-                        try:
-                            phone_button_selectors = [".BfF3H", ".U7pYf", "button[aria-label*='전화']"]
-                            for sel in phone_button_selectors:
-                                try:
-                                    phone_button = driver.find_element(By.CSS_SELECTOR, sel)
-                                    driver.execute_script("arguments[0].click();", phone_button)
-                                    time.sleep(1)
-                                    break
-                                except:
-                                    continue
-                            
-                            phone_selectors = [".J7eF_", ".xlx7Q", ".RiCN3", "span.xlx7Q", "a[href^='tel:']"]
-                            for sel in phone_selectors:
-                                try:
-                                    phone_elem = driver.find_element(By.CSS_SELECTOR, sel)
-                                    phone_text = phone_elem.text.strip()
-                                    if phone_text and re.search(r'\d{2,}', phone_text):
-                                        phone_text = phone_text.replace('복사', '').replace('휴대전화번호', '').replace('전화번호', '').replace('전화', '').strip()
-                                        phone = ' '.join(phone_text.split())
-                                        break
-                                except:
-                                    continue
-                        except:
-                            pass
-                        
-                        if name != "정보 없음":
-                            # 최종 정제
-                            if road_address != "정보 없음":
-                                road_address = road_address.replace('도로명', '').replace('복사', '').replace('주소', '').strip()
-                                road_address = road_address.strip('[](){}|').strip()
-                            if jibun_address != "정보 없음":
-                                jibun_address = jibun_address.replace('지번', '').replace('복사', '').replace('주소', '').strip()
-                                jibun_address = jibun_address.strip('[](){}|').strip()
-                            if phone != "정보 없음":
-                                phone = phone.replace('휴대전화번호', '').replace('전화번호', '').replace('전화', '').replace('복사', '').replace('연락처', '').strip()
-                                phone = phone.strip('[](){}|').strip()
-                                phone = ' '.join(phone.split())
-                            
-                            data.append([name, road_address, jibun_address, phone])
-                            collected_count += 1
-                            self.status_callback(f"[데모] ({collected_count}/3) {name} 정보 수집 완료")
-                            
-                            if collected_count >= 3:
-                                self.status_callback(f"[데모 버전] 3개 수집 완료. 더 많은 정보는 정식 버전에서!")
-                                break
-                        
-                    except TimeoutException:
-                        self.status_callback(f"[데모] ({i + 1}/3번째 항목에서 상세 정보를 찾을 수 없음)")
-                    except Exception as e:
-                        self.status_callback(f"[데모] ({i + 1}/3번째 항목 처리 중 오류: {str(e)}")
-                    
-                except Exception as e:
-                    self.status_callback(f"[데모] 항목 처리 중 오류: {str(e)}")
-                    continue
-
-            self.status_callback(f"[데모 버전] 크롤링 완료. 총 {collected_count}개의 정보를 수집했습니다.")
-
-        except Exception as e:
-            self.status_callback(f"[데모] 크롤링 프로세스 중 오류 발생: {str(e)}")
-        finally:
-            if driver:
-                driver.quit()
-            self.callback(data)
-
-    def stop(self):
-        self.is_running = False
+from crawler import CrawlerThread
+from async_engine import AsyncCrawlerThread
+from place_cache import PlaceCache, DEFAULT_CACHE_PATH
+from exporter import StreamingExporter, DEFAULT_SPOOL_DIR
+from crawl_journal import CrawlJournal, journal_path
+from crawl_events import CrawlEventStream, ProgressTracker, drain
+from browser_session import BrowserSessionManager, create_chrome_driver, browsers_per_crawl, DEFAULT_DISK_CACHE_DIR
 
+# 크롤링 스레드가 보낸 이벤트를 화면에 반영하는 주기 (밀리초) / 한 번에 처리할 최대 이벤트 수
+EVENT_POLL_MS = 100
+EVENT_BATCH = 200
 
 class NaverMapCrawlerApp:
-    def __init__(self, root):
+    def __init__(self, root, workers=1, direct=False, backend="selenium", cache=None, sessions=None):
         self.root = root
+        self.cache = cache
+        self.sessions = sessions
+        self.exporter = None
+        self.workers = workers
+        self.direct = direct
+        self.backend = backend
         self.root.title("Naver Map Crawler v2.0 - DEMO VERSION")
-        self.root.geometry("700x400")
+        self.root.geometry("760x620")
         
         # 스타일 설정
         style = ttk.Style()
@@ -278,7 +36,17 @@ class NaverMapCrawlerApp:
         style.configure('Demo.TLabel', font=('Arial', 12, 'bold'), foreground='red')
         
         self.crawler_thread = None
+        # 작업 스레드는 Tk 위젯을 직접 건드리지 않고 이벤트만 보낸다. (메인 루프에서 root.after로 처리)
+        self.events = CrawlEventStream()
+        self.event_queue = self.events.subscribe()
+        self.progress = ProgressTracker()
         self.setup_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.poll_id = self.root.after(EVENT_POLL_MS, self.poll_events)
+        
+        # 첫 검색 전에 브라우저를 미리 띄워둔다 (창은 바로 뜨도록 백그라운드에서)
+        if self.sessions is not None and self.backend == "selenium":
+            threading.Thread(target=self.prewarm, daemon=True).start()
         
     def setup_ui(self):
         # 메인 프레임
@@ -307,8 +75,13 @@ class NaverMapCrawlerApp:
         max_count_label = ttk.Label(search_frame, text="3 (고정)", foreground='gray')
         max_count_label.grid(row=0, column=3, padx=5)
         
+        ttk.Label(search_frame, text="브라우저 수:").grid(row=0, column=4, padx=5)
+        self.workers_var = tk.StringVar(value=str(self.workers))
+        workers_spinbox = ttk.Spinbox(search_frame, from_=1, to=8, width=3, textvariable=self.workers_var)
+        workers_spinbox.grid(row=0, column=5, padx=5)
+        
         self.search_button = ttk.Button(search_frame, text="검색 시작", command=self.start_crawling)
-        self.search_button.grid(row=0, column=4, padx=10)
+        self.search_button.grid(row=0, column=6, padx=10)
         
         # 안내 메시지
         info_text = "• 검색 결과를 엑셀 파일로 저장합니다.\n• 수집 항목: 장소명, 도로명 주소, 지번 주소, 전화번호\n• ⚠️ 데모 버전은 3개 항목만 수집 가능합니다."
@@ -320,14 +93,32 @@ class NaverMapCrawlerApp:
                                    command=self.show_purchase_info)
         purchase_button.grid(row=4, column=0, columnspan=3, pady=10)
         
+        # 수집 결과 (수집되는 즉시 한 줄씩 추가)
+        result_frame = ttk.Frame(main_frame)
+        result_frame.grid(row=5, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(10, 0))
+        columns = ("name", "road_address", "jibun_address", "phone")
+        self.result_tree = ttk.Treeview(result_frame, columns=columns, show='headings', height=6)
+        for column, heading, width in zip(columns, ("장소명", "도로명 주소", "지번 주소", "전화번호"), (150, 210, 180, 110)):
+            self.result_tree.heading(column, text=heading)
+            self.result_tree.column(column, width=width)
+        result_scroll = ttk.Scrollbar(result_frame, orient=tk.VERTICAL, command=self.result_tree.yview)
+        self.result_tree.configure(yscrollcommand=result_scroll.set)
+        self.result_tree.grid(row=0, column=0, sticky=(tk.W, tk.E))
+        result_scroll.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        
+        # 진행 상황 (수집 개수 / 분당 처리량 / 남은 시간)
+        self.progress_var = tk.StringVar(value="")
+        progress_label = ttk.Label(main_frame, textvariable=self.progress_var, foreground='gray')
+        progress_label.grid(row=6, column=0, columnspan=3, sticky=tk.W, pady=(5, 0))
+        
         # 상태바
         self.status_var = tk.StringVar(value="[데모 버전] 준비 완료")
         self.status_bar = ttk.Label(main_frame, textvariable=self.status_var, relief=tk.SUNKEN)
-        self.status_bar.grid(row=5, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(20, 0))
+        self.status_bar.grid(row=7, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(10, 0))
         
         # By 라벨
         by_label = ttk.Label(main_frame, text="By ANYCODER | v2.0 DEMO", foreground='gray')
-        by_label.grid(row=6, column=0, columnspan=3, pady=(10, 0))
+        by_label.grid(row=8, column=0, columnspan=3, pady=(10, 0))
         
     def show_purchase_info(self):
         messagebox.showinfo(
@@ -357,17 +148,72 @@ class NaverMapCrawlerApp:
             
         self.search_button.config(state='disabled', text="크롤링 중...")
         self.search_entry.config(state='disabled')
+        self.result_tree.delete(*self.result_tree.get_children())
+        self.progress_var.set("")
+        
+        try:
+            workers = max(1, int(self.workers_var.get()))
+        except ValueError:
+            workers = 1
+        
+        # 수집되는 행을 바로 자동 저장 파일에 기록 (중간에 멈춰도 데이터 보존)
+        try:
+            self.exporter = self.create_exporter(keyword)
+        except OSError:
+            self.exporter = None
         
-        self.crawler_thread = CrawlerThread(keyword, 3, self.crawling_finished, self.update_status)
+        # 중간에 멈췄던 같은 검색어가 있으면 완료된 장소는 건너뛰고 이어서 수집
+        try:
+            journal = CrawlJournal(journal_path(keyword), keyword)
+        except OSError:
+            journal = None
+        
+        if self.backend == "async":
+            self.crawler_thread = AsyncCrawlerThread(keyword, 3, self.events.finished, self.events.status,
+                                                     exporter=self.exporter, journal=journal, events=self.events,
+                                                     concurrency=workers)
+        else:
+            self.crawler_thread = CrawlerThread(keyword, 3, self.events.finished, self.events.status,
+                                                workers=workers, direct=self.direct, cache=self.cache,
+                                                exporter=self.exporter, sessions=self.sessions, journal=journal,
+                                                events=self.events)
         self.crawler_thread.start()
         
-    def update_status(self, message):
-        self.status_var.set(message)
-        self.root.update_idletasks()
+    def prewarm(self):
+        try:
+            self.sessions.prewarm(1)
+        except Exception:
+            pass
+        
+    def on_close(self):
+        self.root.after_cancel(self.poll_id)
+        if self.crawler_thread and self.crawler_thread.is_alive():
+            self.crawler_thread.stop()
+        if self.sessions is not None:
+            self.sessions.close()
+        self.root.destroy()
+        
+    def poll_events(self):
+        # 메인 스레드에서 쌓인 이벤트를 한꺼번에 반영하고 다음 확인을 예약한다.
+        try:
+            events = drain(self.event_queue, EVENT_BATCH)
+            for event in events:
+                self.progress.update(event)
+                if event.kind == "status":
+                    self.status_var.set(event.data["message"])
+                elif event.kind == "row":
+                    self.result_tree.insert('', tk.END, values=event.data["row"][:4])
+                elif event.kind == "finished":
+                    self.crawling_finished(event.data["data"])
+            if events and self.crawler_thread is not None and self.crawler_thread.is_alive():
+                self.progress_var.set(self.progress.text())
+        finally:
+            self.poll_id = self.root.after(EVENT_POLL_MS, self.poll_events)
         
     def crawling_finished(self, data):
         self.search_button.config(state='normal', text="검색 시작")
         self.search_entry.config(state='normal')
+        self.progress_var.set(self.progress.text())
         
         if data:
             self.status_var.set(f"[데모 버전] 크롤링 완료. {len(data)}개의 정보를 수집했습니다.")
@@ -385,53 +231,25 @@ class NaverMapCrawlerApp:
         
         file_path = filedialog.asksaveasfilename(
             defaultextension=".xlsx",
-            filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")],
+            filetypes=[("Excel files", "*.xlsx"), ("CSV files", "*.csv"), ("Parquet files", "*.parquet"), ("All files", "*.*")],
             initialfile=default_filename
         )
         
         if file_path:
             try:
-                workbook = openpyxl.Workbook()
-                sheet = workbook.active
-                sheet.title = "네이버 지도 크롤링 결과 (DEMO)"
-                
-                # 데모 버전 워터마크
-                sheet['A1'] = "DEMO VERSION - 정식 버전은 최대 500개까지 수집 가능"
-                sheet['A1'].font = openpyxl.styles.Font(bold=True, color="FF0000")
-                sheet.merge_cells('A1:E1')
-                
-                # 헤더
-                headers = ["번호", "장소명", "도로명 주소", "지번 주소", "전화번호"]
-                sheet.append(headers)
-                
-                # 헤더 스타일
-                for cell in sheet[2]:
-                    cell.font = openpyxl.styles.Font(bold=True)
-                    cell.fill = openpyxl.styles.PatternFill(
-                        start_color="DDDDDD", 
-                        end_color="DDDDDD", 
-                        fill_type="solid"
-                    )
-                
-                # 데이터 추가
-                for idx, item in enumerate(data, 1):
-                    sheet.append([idx] + item)
-                
-                # 열 너비 조정
-                for column in sheet.columns:
-                    max_length = 0
-                    for cell in column:
-                        try:
-                            if cell.value and len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    
-                    if hasattr(column[0], 'column_letter'):
-                        adjusted_width = min(max_length + 2, 50)
-                        sheet.column_dimensions[column[0].column_letter].width = adjusted_width
-                    
-                workbook.save(file_path)
+                # 크롤링 중 스트리밍으로 쌓아둔 스풀 파일을 최종 형식으로 변환
+                exporter = self.exporter
+                if exporter is None or exporter.rows_written == 0:
+                    exporter = self.create_exporter(keyword)
+                    for item in data:
+                        exporter.append(item)
+                exporter.export(
+                    file_path,
+                    title="네이버 지도 크롤링 결과 (DEMO)",
+                    watermark="DEMO VERSION - 정식 버전은 최대 500개까지 수집 가능",
+                )
+                exporter.discard()
+                self.exporter = None
                 
                 messagebox.showinfo(
                     "저장 완료",
@@ -444,11 +262,36 @@ class NaverMapCrawlerApp:
             except Exception as e:
                 messagebox.showerror("저장 실패", f"엑셀 파일 저장 중 오류가 발생했습니다:\n{str(e)}")
                 self.status_var.set("[데모] 저장 실패")
+        elif self.exporter is not None:
+            self.status_var.set(f"[데모] 저장 취소 (자동 저장본: {self.exporter.spool_path})")
+
+    def create_exporter(self, keyword):
+        spool_name = f"네이버지도_DEMO_{keyword}_{time.strftime('%Y%m%d_%H%M%S')}.partial.csv"
+        return StreamingExporter(os.path.join(DEFAULT_SPOOL_DIR, spool_name))
 
 
 def main():
+    parser = argparse.ArgumentParser(description="네이버 지도 크롤러 (데모 버전)")
+    parser.add_argument("--workers", type=int, default=1, help="동시에 사용할 브라우저 수")
+    parser.add_argument("--direct", action="store_true", help="장소 상세 페이지를 HTTP로 직접 수집")
+    parser.add_argument("--backend", choices=["selenium", "async"], default="selenium",
+                        help="크롤링 엔진 (async: 브라우저 없이 asyncio로 HTTP 수집)")
+    parser.add_argument("--headless", action="store_true", help="브라우저 창을 띄우지 않음")
+    parser.add_argument("--lean", action="store_true", help="이미지/폰트/CSS를 받지 않는 가벼운 브라우저 프로필 사용")
+    parser.add_argument("--cache", default=DEFAULT_CACHE_PATH, help="장소 캐시 파일 경로")
+    parser.add_argument("--cache-ttl-days", type=float, default=7, help="캐시 유효 기간 (일)")
+    parser.add_argument("--no-cache", action="store_true", help="장소 캐시를 사용하지 않음")
+    args = parser.parse_args()
+    
+    cache = None if args.no_cache else PlaceCache(args.cache, ttl=args.cache_ttl_days * 24 * 3600)
+    # 검색할 때마다 브라우저를 새로 띄우지 않도록 프로그램이 켜져 있는 동안 세션을 보관
+    driver_factory = partial(create_chrome_driver, headless=args.headless, lean=args.lean,
+                             disk_cache_dir=DEFAULT_DISK_CACHE_DIR)
+    sessions = BrowserSessionManager(driver_factory, max_idle=browsers_per_crawl(max(1, args.workers)))
+    
     root = tk.Tk()
-    app = NaverMapCrawlerApp(root)
+    app = NaverMapCrawlerApp(root, workers=args.workers, direct=args.direct, backend=args.backend, cache=cache,
+                             sessions=sessions)
     root.mainloop()
 
 
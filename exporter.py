@@ -0,0 +1,145 @@
+import os
+import csv
+import shutil
+import threading
+
+import openpyxl
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.cell_range import CellRange
+
+HEADERS = ["번호", "장소명", "도로명 주소", "지번 주소", "전화번호"]
+DEFAULT_SPOOL_DIR = os.path.join(os.path.expanduser("~"), ".naver_map_crawler", "autosave")
+MAX_COLUMN_WIDTH = 50
+
+
+class ExportError(Exception):
+    pass
+
+
+class StreamingExporter:
+    # 크롤링 중 나오는 행을 바로 CSV 스풀 파일에 이어 쓰고 디스크에 내린다.
+    # 크롤링이 중간에 죽어도 스풀 파일(.partial.csv)에 그때까지의 행이 남는다.
+    # 행 하나에 수 초가 걸리므로 기본은 행마다 내리고, 한꺼번에 많이 쓰는 병합(merge_files)만 묶어서 내린다.
+    # 끝나면 export()로 스풀을 한 줄씩 읽어 xlsx(write-only) / csv / parquet로 변환한다.
+    def __init__(self, spool_path, flush_every=1, headers=HEADERS, dedupe=None):
+        self.spool_path = spool_path
+        self.flush_every = max(1, flush_every)
+        self.headers = list(headers)
+        self.rows_written = 0
+        # Deduplicator를 넘기면 이미 저장한 장소(여러 검색어 간 포함)는 건너뛴다.
+        self.dedupe = dedupe
+        self.widths = [len(str(header)) for header in self.headers]
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(spool_path)), exist_ok=True)
+        self._file = open(spool_path, 'w', newline='', encoding='utf-8-sig')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.headers)
+        self.flush()
+
+    def append(self, row, place_id=None):
+        # 저장하면 True, 중복이라 건너뛰면 False
+        with self._lock:
+            if self._file is None:
+                raise ExportError("이미 닫힌 스풀 파일입니다.")
+            if self.dedupe is not None and not self.dedupe.add(row, place_id):
+                return False
+            self.rows_written += 1
+            values = [self.rows_written] + list(row)
+            self._writer.writerow(values)
+            # 열 너비는 행이 들어올 때마다 갱신 (마지막에 전체 셀을 다시 훑지 않음)
+            for index, value in enumerate(values[:len(self.widths)]):
+                self.widths[index] = max(self.widths[index], len(str(value)))
+            if self.rows_written % self.flush_every == 0:
+                self._flush_locked()
+            return True
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._flush_locked()
+                self._file.close()
+                self._file = None
+
+    def discard(self):
+        self.close()
+        if os.path.exists(self.spool_path):
+            os.remove(self.spool_path)
+
+    def _spooled_rows(self):
+        with open(self.spool_path, newline='', encoding='utf-8-sig') as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            for values in reader:
+                if values:
+                    yield [int(values[0])] + values[1:]
+
+    def export(self, path, title=None, watermark=None):
+        # 확장자에 따라 최종 파일로 변환
+        self.close()
+        extension = os.path.splitext(path)[1].lower()
+        if extension == ".csv":
+            shutil.copyfile(self.spool_path, path)
+        elif extension == ".parquet":
+            self._export_parquet(path)
+        else:
+            self._export_xlsx(path, title, watermark)
+        return path
+
+    def _export_xlsx(self, path, title=None, watermark=None):
+        workbook = openpyxl.Workbook(write_only=True)
+        sheet = workbook.create_sheet(title=title or "Sheet")
+
+        # write-only 모드에서는 행을 쓰기 전에 열 너비를 정해야 한다.
+        for index, width in enumerate(self.widths, 1):
+            sheet.column_dimensions[get_column_letter(index)].width = min(width + 2, MAX_COLUMN_WIDTH)
+
+        if watermark:
+            cell = WriteOnlyCell(sheet, value=watermark)
+            cell.font = openpyxl.styles.Font(bold=True, color="FF0000")
+            sheet.merged_cells.add(CellRange(min_col=1, min_row=1, max_col=len(self.headers), max_row=1))
+            sheet.append([cell])
+
+        header_cells = []
+        for header in self.headers:
+            cell = WriteOnlyCell(sheet, value=header)
+            cell.font = openpyxl.styles.Font(bold=True)
+            cell.fill = openpyxl.styles.PatternFill(
+                start_color="DDDDDD",
+                end_color="DDDDDD",
+                fill_type="solid"
+            )
+            header_cells.append(cell)
+        sheet.append(header_cells)
+
+        for values in self._spooled_rows():
+            sheet.append(values)
+        workbook.save(path)
+
+    def _export_parquet(self, path, batch_size=1000):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ExportError("Parquet 저장에는 pyarrow 패키지가 필요합니다.")
+
+        schema = pa.schema([(header, pa.int64() if index == 0 else pa.string())
+                            for index, header in enumerate(self.headers)])
+        with pq.ParquetWriter(path, schema) as writer:
+            batch = []
+            for values in self._spooled_rows():
+                batch.append(values)
+                if len(batch) >= batch_size:
+                    writer.write_table(pa.Table.from_pylist([dict(zip(self.headers, v)) for v in batch], schema))
+                    batch = []
+            if batch:
+                writer.write_table(pa.Table.from_pylist([dict(zip(self.headers, v)) for v in batch], schema))
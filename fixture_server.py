@@ -0,0 +1,353 @@
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, unquote
+
+# 로컬 벤치마크용 가짜 네이버 지도 페이지
+# searchIframe / entryIframe 구조와 클래스명을 실제 사이트와 동일하게 흉내낸다.
+
+FIXTURE_PLACES = [
+    {"id": "1000001", "name": "테스트 카페 강남점", "road": "서울 강남구 테헤란로 123", "jibun": "서울 강남구 역삼동 456-7", "phone": "02-1234-5678"},
+    {"id": "1000002", "name": "테스트 식당", "road": "서울 마포구 월드컵북로 45", "jibun": "서울 마포구 성산동 12-3", "phone": "02-333-4444"},
+    {"id": "1000003", "name": "테스트 베이커리", "road": "부산 해운대구 해운대로 77길 8", "jibun": "부산 해운대구 우동 1400-1", "phone": "051-777-8888"},
+    {"id": "1000004", "name": "테스트 서점", "road": "대전 유성구 대학로 99", "jibun": "대전 유성구 궁동 220", "phone": "042-555-6666"},
+    {"id": "1000005", "name": "테스트 약국", "road": "경기 수원시 팔달구 정조로 800", "jibun": "경기 수원시 팔달구 남창동 10-2", "phone": "031-222-1111"},
+]
+
+# 저장해둔 실제 페이지 (searchIframe / entryIframe)
+DEFAULT_RECORDED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# 기존 코드의 고정 sleep 합계 (비교용)
+LEGACY_SETUP_SLEEP = 3 + 2 + 2
+LEGACY_PER_PLACE_SLEEP = 1 + 1 + 2 + 1 + 1 + 1
+
+_MAP_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>fixture map</title></head>
+<body>
+<iframe id="searchIframe" src="/list?query={query}" width="400" height="800"></iframe>
+<div id="entryWrap"></div>
+</body></html>"""
+
+_ENTRY_MAP_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>fixture map</title></head>
+<body>
+<div id="entryWrap"><iframe id="entryIframe" src="/entry/{place_id}" width="400" height="800"></iframe></div>
+</body></html>"""
+
+_LIST_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"></head>
+<body>
+<div id="_pcmap_list_scroll_container" style="height: 300px; overflow-y: scroll;"><ul id="list"></ul></div>
+<script>
+var places = {places};
+function openEntry(id) {{
+    setTimeout(function () {{
+        var doc = parent.document;
+        var frame = doc.getElementById('entryIframe');
+        if (!frame) {{
+            frame = doc.createElement('iframe');
+            frame.id = 'entryIframe';
+            frame.width = 400;
+            frame.height = 800;
+            doc.getElementById('entryWrap').appendChild(frame);
+        }}
+        frame.src = '/entry/' + id;
+    }}, {click_delay_ms});
+}}
+// 스크롤이 바닥에 닿으면 다음 묶음을 렌더링 (무한 스크롤 흉내)
+var rendered = 0;
+var loading = false;
+function renderBatch() {{
+    loading = true;
+    setTimeout(function () {{
+        var list = document.getElementById('list');
+        places.slice(rendered, rendered + {batch_size}).forEach(function (p) {{
+            var li = document.createElement('li');
+            li.style.height = '80px';
+            li.innerHTML = '<a class="place_bluelink" role="button" data-id="' + p.id + '" onclick="openEntry(\\'' + p.id + '\\')">'
+                + '<span class="YwYLL">' + p.name + '</span></a>';
+            list.appendChild(li);
+        }});
+        rendered = Math.min(places.length, rendered + {batch_size});
+        loading = false;
+    }}, {render_delay_ms});
+}}
+document.getElementById('_pcmap_list_scroll_container').addEventListener('scroll', function () {{
+    var el = this;
+    if (!loading && rendered < places.length && el.scrollTop + el.clientHeight >= el.scrollHeight - 10) {{
+        renderBatch();
+    }}
+}});
+renderBatch();
+</script>
+</body></html>"""
+
+_ENTRY_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"></head>
+<body>
+<div id="root"></div>
+<script>
+var p = {place};
+setTimeout(function () {{
+    document.getElementById('root').innerHTML =
+        '<div><span class="GHAhO">' + p.name + '</span></div>'
+        + '<div><a class="PkgBl" href="#" onclick="showAddress(); return false;">' + p.road + '</a><div id="addr"></div></div>'
+        + '<div><a class="BfF3H" href="#" onclick="showPhone(); return false;">전화번호</a><div id="phone"></div></div>';
+}}, {render_delay_ms});
+function showAddress() {{
+    setTimeout(function () {{
+        document.getElementById('addr').innerHTML =
+            '<div class="nQ7Lh"><span>도로명</span>' + p.road + '<span>복사</span></div>'
+            + '<div class="nQ7Lh"><span>지번</span>' + p.jibun + '<span>복사</span></div>';
+    }}, {expand_delay_ms});
+}}
+function showPhone() {{
+    setTimeout(function () {{
+        document.getElementById('phone').innerHTML = '<span class="xlx7Q">' + p.phone + '</span><span>복사</span>';
+    }}, {expand_delay_ms});
+}}
+</script>
+</body></html>"""
+
+
+# 저장본에는 원래 스크립트가 없으므로 목록 클릭 → entryIframe 로딩만 붙여준다.
+_RECORDED_CLICK_SCRIPT = """
+<script>
+document.addEventListener('click', function (event) {
+    var link = event.target.closest('a.place_bluelink, a[role="button"]');
+    var li = link && link.closest('li');
+    var id = link && (link.getAttribute('data-id') || (li && li.getAttribute('data-id')));
+    var match = !id && link && (link.getAttribute('href') || '').match(/place\\/(\\d+)/);
+    id = id || (match && match[1]);
+    if (!id) { return; }
+    event.preventDefault();
+    var doc = parent.document;
+    var frame = doc.getElementById('entryIframe');
+    if (!frame) {
+        frame = doc.createElement('iframe');
+        frame.id = 'entryIframe';
+        frame.width = 400;
+        frame.height = 800;
+        doc.getElementById('entryWrap').appendChild(frame);
+    }
+    frame.src = '/entry/' + id;
+});
+</script>
+</body>"""
+
+# 차단 상황 재현용 캡차 페이지
+_CAPTCHA_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>네이버 : 보안 확인</title></head>
+<body><div id="ncaptcha">자동입력 방지를 위해 아래 이미지의 문자를 입력해주세요.</div></body></html>
+"""
+
+_PCMAP_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"></head>
+<body>
+<div id="app-root"></div>
+<script>window.__APOLLO_STATE__ = {state};</script>
+</body></html>"""
+
+
+def apollo_detail_state(place):
+    return {
+        f"PlaceDetailBase:{place['id']}": {
+            "__typename": "PlaceDetailBase",
+            "id": place["id"],
+            "name": place["name"],
+            "roadAddress": place["road"],
+            "address": place["jibun"],
+            "phone": place["phone"],
+        }
+    }
+
+
+def apollo_list_state(places):
+    return {f"PlaceSummary:{place['id']}": {"id": place["id"], "name": place["name"]} for place in places}
+
+
+class FixtureConfig:
+    def __init__(self, page_delay=0.2, render_delay=0.3, click_delay=0.2, expand_delay=0.1, places=None, batch_size=20,
+                 jitter=0.0, recorded_dir=None, seed=None, throttle_rate=0.0, captcha_rate=0.0):
+        self.page_delay = page_delay        # 서버 응답 지연
+        self.jitter = jitter                # 응답 지연에 더할 무작위 편차 (±초)
+        self.render_delay = render_delay    # 클라이언트 렌더링 지연
+        self.click_delay = click_delay      # 클릭 후 entryIframe 로딩 지연
+        self.expand_delay = expand_delay    # 주소/전화번호 펼침 지연
+        self.places = places or FIXTURE_PLACES
+        self.batch_size = batch_size        # 스크롤 한 번에 렌더링되는 항목 수
+        self.recorded_dir = recorded_dir    # 지정하면 저장된 실제 페이지를 그대로 제공
+        self.throttle_rate = throttle_rate  # 이 비율만큼 HTTP 429 응답
+        self.captcha_rate = captcha_rate    # 이 비율만큼 캡차 페이지 응답
+        self.random = random.Random(seed)
+
+    def delay(self):
+        if not self.jitter:
+            return self.page_delay
+        return max(0.0, self.page_delay + self.random.uniform(-self.jitter, self.jitter))
+
+    def recorded(self, name):
+        # 저장본이 없으면 None (합성 페이지로 대체)
+        if not self.recorded_dir:
+            return None
+        path = os.path.join(self.recorded_dir, name)
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding='utf-8') as f:
+            return f.read()
+
+
+def make_handler(config):
+    class FixtureHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, body, status=200):
+            data = body.encode('utf-8')
+            self.send_response(status)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            time.sleep(config.delay())
+            path = unquote(urlparse(self.path).path)
+            if config.throttle_rate and config.random.random() < config.throttle_rate:
+                self._send("Too Many Requests", 429)
+                return
+            if config.captcha_rate and config.random.random() < config.captcha_rate:
+                self._send(_CAPTCHA_PAGE)
+                return
+            ms = lambda seconds: int(seconds * 1000)
+
+            if path.startswith("/p/search/"):
+                self._send(_MAP_PAGE.format(query=path[len("/p/search/"):]))
+            elif path.startswith("/p/entry/place/"):
+                self._send(_ENTRY_MAP_PAGE.format(place_id=path[len("/p/entry/place/"):]))
+            elif path == "/list" and config.recorded("search_iframe.html"):
+                page = config.recorded("search_iframe.html")
+                self._send(page.replace("</body>", _RECORDED_CLICK_SCRIPT, 1))
+            elif path == "/list":
+                self._send(_LIST_PAGE.format(
+                    places=json.dumps(config.places, ensure_ascii=False),
+                    click_delay_ms=ms(config.click_delay),
+                    render_delay_ms=ms(config.render_delay),
+                    batch_size=max(1, config.batch_size),
+                ))
+            elif path == "/place/list":
+                state = apollo_list_state(config.places)
+                self._send(_PCMAP_PAGE.format(state=json.dumps(state, ensure_ascii=False)))
+            elif path.startswith("/place/") and path.endswith("/home"):
+                place_id = path[len("/place/"):-len("/home")]
+                place = next((p for p in config.places if p["id"] == place_id), None)
+                if place is None:
+                    self._send("not found", 404)
+                    return
+                state = apollo_detail_state(place)
+                self._send(_PCMAP_PAGE.format(state=json.dumps(state, ensure_ascii=False)))
+            elif path.startswith("/entry/") and config.recorded("entry_iframe.html"):
+                place_id = path[len("/entry/"):]
+                self._send(config.recorded(f"entry_{place_id}.html") or config.recorded("entry_iframe.html"))
+            elif path.startswith("/entry/"):
+                place_id = path[len("/entry/"):]
+                place = next((p for p in config.places if p["id"] == place_id), None)
+                if place is None:
+                    self._send("not found", 404)
+                    return
+                self._send(_ENTRY_PAGE.format(
+                    place=json.dumps(place, ensure_ascii=False),
+                    render_delay_ms=ms(config.render_delay),
+                    expand_delay_ms=ms(config.expand_delay),
+                ))
+            else:
+                self._send("not found", 404)
+
+    return FixtureHandler
+
+
+def start_fixture_server(config=None, host="127.0.0.1", port=0):
+    server = ThreadingHTTPServer((host, port), make_handler(config or FixtureConfig()))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def run_readiness_benchmark(config=None, keyword="테스트", workers=1, direct=False):
+    from crawler import CrawlerThread
+    from place_fetcher import HttpPlaceFetcher
+    from place_extractor import SELECTOR_GROUPS
+    from selector_registry import SelectorRegistry
+
+    server, base_url = start_fixture_server(config)
+    result = {}
+    messages = []
+
+    def on_done(data):
+        result["data"] = data
+
+    try:
+        start = time.perf_counter()
+        fetcher = HttpPlaceFetcher(base_url=base_url) if direct else None
+        # 픽스처 페이지의 적중 / 실패가 사용자의 셀렉터 학습 파일에 섞이지 않도록 저장하지 않는 레지스트리를 쓴다.
+        crawler = CrawlerThread(keyword, 3, on_done, messages.append, base_url=base_url, workers=workers, fetcher=fetcher,
+                                registry=SelectorRegistry(None, SELECTOR_GROUPS))
+        crawler.start()
+        crawler.join()
+        elapsed = time.perf_counter() - start
+    finally:
+        server.shutdown()
+
+    count = len(result.get("data") or [])
+    return {
+        "workers": workers,
+        "direct": direct,
+        "places": count,
+        "elapsed": round(elapsed, 3),
+        "per_place": round(elapsed / count, 3) if count else None,
+        "legacy_sleep_budget": LEGACY_SETUP_SLEEP + LEGACY_PER_PLACE_SLEEP * count,
+        "steps": crawler.metrics.report()["stages"],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="네이버 지도 로컬 픽스처 서버")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--page-delay", type=float, default=0.2)
+    parser.add_argument("--render-delay", type=float, default=0.3)
+    parser.add_argument("--click-delay", type=float, default=0.2)
+    parser.add_argument("--expand-delay", type=float, default=0.1)
+    parser.add_argument("--batch-size", type=int, default=20, help="스크롤 한 번에 렌더링되는 항목 수")
+    parser.add_argument("--jitter", type=float, default=0.0, help="응답 지연 편차 (±초)")
+    parser.add_argument("--recorded", action="store_true", help="fixtures 폴더의 저장된 실제 페이지를 제공")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="HTTP 429로 응답할 요청 비율")
+    parser.add_argument("--captcha-rate", type=float, default=0.0, help="캡차 페이지로 응답할 요청 비율")
+    parser.add_argument("--bench", action="store_true", help="대기 엔진 벤치마크 실행 후 종료")
+    parser.add_argument("--workers", type=int, default=1, help="벤치마크에 사용할 브라우저 수")
+    parser.add_argument("--direct", action="store_true", help="HTTP 직접 수집 모드로 벤치마크")
+    args = parser.parse_args(argv)
+
+    config = FixtureConfig(args.page_delay, args.render_delay, args.click_delay, args.expand_delay,
+                           batch_size=args.batch_size, jitter=args.jitter,
+                           recorded_dir=DEFAULT_RECORDED_DIR if args.recorded else None,
+                           throttle_rate=args.throttle_rate, captcha_rate=args.captcha_rate)
+    if args.bench:
+        print(json.dumps(run_readiness_benchmark(config, workers=args.workers, direct=args.direct), ensure_ascii=False, indent=2))
+        return
+
+    server, base_url = start_fixture_server(config, port=args.port)
+    print(f"픽스처 서버 실행 중: {base_url}/p/search/테스트")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,92 @@
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from place_extractor import harvest_place_ids
+
+# 검색 결과 목록의 스크롤 영역 후보
+SCROLL_CONTAINER_SELECTORS = ["#_pcmap_list_scroll_container", "div.Ryr1F", "div[role='main']"]
+
+_SCROLL_JS = """
+var selectors = arguments[0];
+for (var i = 0; i < selectors.length; i++) {
+    var el = document.querySelector(selectors[i]);
+    if (el && el.scrollHeight > el.clientHeight) {
+        el.scrollTop = el.scrollHeight;
+        return true;
+    }
+}
+window.scrollTo(0, document.body.scrollHeight);
+return false;
+"""
+
+# 페이지 이동 버튼(이전/다음) 중 마지막 버튼이 활성화되어 있으면 클릭
+_NEXT_PAGE_JS = """
+var buttons = document.querySelectorAll('a.eUTV2');
+if (!buttons.length) return false;
+var next = buttons[buttons.length - 1];
+if (next.getAttribute('aria-disabled') === 'true') return false;
+next.click();
+return true;
+"""
+
+
+class ResultHarvester:
+    # searchIframe을 스크롤/페이지 이동하며 새로 렌더링된 장소 ID를 바로바로 내보낸다.
+    # 요청 개수에 도달하거나 더 이상 새 항목이 없으면 멈춘다.
+    def __init__(self, driver, waiter, max_count, idle_rounds=1, max_pages=5):
+        self.driver = driver
+        self.waiter = waiter
+        self.max_count = max_count
+        self.idle_rounds = idle_rounds
+        self.max_pages = max_pages
+        self.seen = set()
+        self.scrolls = 0
+        self.pages = 1
+
+    def _new_ids(self):
+        # seen에는 실제로 내보낸 ID만 넣는다. (렌더링만 되고 개수 제한으로 내보내지 않은 ID는 제외)
+        return [place_id for place_id in harvest_place_ids(self.driver) if place_id not in self.seen]
+
+    def _wait_for_new(self, step):
+        # 아직 보지 못한 장소가 렌더링될 때까지 대기
+        def _has_new(driver):
+            return any(place_id not in self.seen for place_id in harvest_place_ids(driver))
+
+        try:
+            self.waiter.until(step, _has_new)
+            return True
+        except TimeoutException:
+            return False
+
+    def __iter__(self):
+        idle = 0
+        while len(self.seen) < self.max_count:
+            fresh = self._new_ids()
+            for place_id in fresh:
+                self.seen.add(place_id)
+                yield place_id
+                if len(self.seen) >= self.max_count:
+                    return
+
+            idle = 0 if fresh else idle + 1
+            if idle > self.idle_rounds:
+                # 스크롤로 더 안 나오면 다음 페이지로
+                if self.pages >= self.max_pages or not self._next_page():
+                    return
+                idle = 0
+                continue
+
+            try:
+                self.driver.execute_script(_SCROLL_JS, SCROLL_CONTAINER_SELECTORS)
+            except WebDriverException:
+                return
+            self.scrolls += 1
+            self._wait_for_new("scroll_more")
+
+    def _next_page(self):
+        try:
+            if not self.driver.execute_script(_NEXT_PAGE_JS):
+                return False
+        except WebDriverException:
+            return False
+        self.pages += 1
+        return self._wait_for_new("next_page")
@@ -0,0 +1,213 @@
+import os
+import json
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+# 단계별 지연시간 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+METRIC_PREFIX = "naver_crawler"
+
+
+class Histogram:
+    # Prometheus 방식의 누적 구간 히스토그램 + 백분위 계산용 최근 샘플
+    def __init__(self, buckets=DEFAULT_BUCKETS, max_samples=10000):
+        self.buckets = tuple(sorted(buckets))
+        self.bucket_counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.samples = deque(maxlen=max_samples)
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+        self.samples.append(value)
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.bucket_counts[index] += 1
+
+    def percentile(self, q):
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "total": round(self.sum, 3),
+            "avg": round(self.sum / self.count, 3) if self.count else 0.0,
+            "p50": round(self.percentile(0.5), 3),
+            "p95": round(self.percentile(0.95), 3),
+            "max": round(self.max, 3),
+            "buckets": {str(bound): count for bound, count in zip(self.buckets, self.bucket_counts)},
+        }
+
+
+def _label_key(labels):
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _label_text(labels, extra=None):
+    pairs = list(labels) + list(extra or [])
+    if not pairs:
+        return ""
+    escaped = (f'{key}="{value}"'.replace("\n", " ") for key, value in pairs)
+    return "{" + ",".join(escaped) + "}"
+
+
+class CrawlMetrics:
+    # 크롤링 단계별 지연시간 / 카운터를 모아 JSON 리포트와 Prometheus 텍스트로 내보낸다.
+    # 여러 크롤러 스레드가 같은 인스턴스를 공유해도 된다.
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.histograms = {}
+        self.counters = {}
+        self.started = time.time()
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def observe(self, stage, seconds):
+        with self._lock:
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    @contextmanager
+    def time(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def count(self, name, amount=1, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def total(self, name):
+        with self._lock:
+            return sum(value for (counter, _), value in self.counters.items() if counter == name)
+
+    def elapsed(self):
+        return time.perf_counter() - self._started
+
+    def places_per_minute(self):
+        elapsed = self.elapsed()
+        return round(self.total("places_total") * 60 / elapsed, 2) if elapsed > 0 else 0.0
+
+    def report(self):
+        with self._lock:
+            stages = {stage: histogram.summary() for stage, histogram in self.histograms.items()}
+            counters = {}
+            for (name, labels), value in sorted(self.counters.items()):
+                label = ",".join(f"{key}={value_}" for key, value_ in labels)
+                counters.setdefault(name, {})[label or "total"] = value
+        return {
+            "started": self.started,
+            "elapsed": round(self.elapsed(), 3),
+            "places_per_minute": self.places_per_minute(),
+            "stages": stages,
+            "counters": counters,
+        }
+
+    def summary_text(self, limit=4):
+        # 상태 표시줄용 한 줄 요약 (누적 시간이 큰 단계부터)
+        with self._lock:
+            stages = sorted(self.histograms.items(), key=lambda kv: -kv[1].sum)[:limit]
+            parts = [f"{stage} p50 {histogram.percentile(0.5):.2f}s/p95 {histogram.percentile(0.95):.2f}s"
+                     for stage, histogram in stages]
+        return f"분당 {self.places_per_minute()}개, " + ", ".join(parts)
+
+    def prometheus_text(self):
+        lines = []
+        name = f"{METRIC_PREFIX}_stage_seconds"
+        with self._lock:
+            if self.histograms:
+                lines.append(f"# HELP {name} Time spent in each crawl stage.")
+                lines.append(f"# TYPE {name} histogram")
+            for stage, histogram in sorted(self.histograms.items()):
+                labels = [("stage", stage)]
+                for bound, count in zip(histogram.buckets, histogram.bucket_counts):
+                    lines.append(f"{name}_bucket{_label_text(labels, [('le', bound)])} {count}")
+                lines.append(f"{name}_bucket{_label_text(labels, [('le', '+Inf')])} {histogram.count}")
+                lines.append(f"{name}_sum{_label_text(labels)} {histogram.sum:.6f}")
+                lines.append(f"{name}_count{_label_text(labels)} {histogram.count}")
+
+            declared = set()
+            for (counter, labels), value in sorted(self.counters.items()):
+                metric = f"{METRIC_PREFIX}_{counter}"
+                if metric not in declared:
+                    declared.add(metric)
+                    lines.append(f"# TYPE {metric} counter")
+                lines.append(f"{metric}{_label_text(labels)} {value}")
+
+        gauge = f"{METRIC_PREFIX}_places_per_minute"
+        lines.append(f"# TYPE {gauge} gauge")
+        lines.append(f"{gauge} {self.places_per_minute()}")
+        return "\n".join(lines) + "\n"
+
+    def write_json(self, path):
+        _write_atomic(path, json.dumps(self.report(), ensure_ascii=False, indent=2))
+        return path
+
+    def write_prometheus(self, path):
+        # node_exporter textfile collector가 읽다 만 파일을 보지 않도록 교체 방식으로 쓴다.
+        _write_atomic(path, self.prometheus_text())
+        return path
+
+
+def _write_atomic(path, text):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+class Profiler:
+    # 선택적 프로파일링 훅: "cprofile"(표준 라이브러리) 또는 "pyinstrument"(설치된 경우)
+    # 크롤링은 작업 스레드에서 돌기 때문에 해당 스레드 안에서 start/stop 해야 한다.
+    def __init__(self, kind, path):
+        self.kind = kind
+        self.path = path
+        self._profiler = None
+
+    def start(self):
+        if self.kind == "pyinstrument":
+            try:
+                from pyinstrument import Profiler as PyinstrumentProfiler
+            except ImportError:
+                raise RuntimeError("pyinstrument 프로파일링에는 pyinstrument 패키지가 필요합니다.")
+            self._profiler = PyinstrumentProfiler()
+            self._profiler.start()
+        else:
+            import cProfile
+            self._profiler = cProfile.Profile()
+            try:
+                self._profiler.enable()
+            except ValueError as e:
+                # Python 3.12부터는 프로세스 전체에서 cProfile을 하나만 켤 수 있다.
+                self._profiler = None
+                raise RuntimeError(f"프로파일러를 시작할 수 없습니다: {e}")
+        return self
+
+    def stop(self):
+        if self._profiler is None:
+            return None
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        if self.kind == "pyinstrument":
+            self._profiler.stop()
+            with open(self.path, 'w', encoding='utf-8') as f:
+                f.write(self._profiler.output_html())
+        else:
+            self._profiler.disable()
+            # python -m pstats <파일> 또는 snakeviz로 열어볼 수 있다.
+            self._profiler.dump_stats(self.path)
+        self._profiler = None
+        return self.path
@@ -0,0 +1,235 @@
+import os
+import re
+import csv
+import sys
+import hashlib
+import argparse
+import threading
+from functools import lru_cache
+
+NO_INFO = "정보 없음"
+
+# 상세 페이지에서 값 옆에 함께 읽히는 라벨 / 버튼 텍스트
+_NAME_NOISE = re.compile(r'복사')
+_ADDRESS_NOISE = re.compile(r'복사|도로명|지번|주소')
+_PHONE_NOISE = re.compile(r'휴대전화번호|전화번호|연락처|전화|복사')
+_SPACES = re.compile(r'\s+')
+_NON_DIGITS = re.compile(r'\D+')
+_EDGE_CHARS = '[](){}| '
+_NO_SPACES = str.maketrans('', '', ' \t\r\n\xa0')
+
+# 도로명 주소는 '~로 / ~길', 지번 주소는 '~동 / ~리' 또는 '123-4' 형태의 번지
+_ROAD_HINT = re.compile(r'[로길]')
+_JIBUN_HINT = re.compile(r'[동리]|\d+-\d+')
+
+_ADDRESS = re.compile(
+    r'^(?P<sido>\S+)'
+    r'(?:\s+(?P<sigungu>(?:\S+[시군]\s+)?\S+[시군구]))?'
+    r'\s+(?P<street>(?:\S+[읍면]\s+)?\S+?(?:로|길|동|리|가)(?:\s*\d+번?길)?)'
+    r'(?:\s*(?P<number>(?:산\s*)?\d+(?:-\d+)?))?'
+    r'(?:\s+(?P<detail>.+))?$'
+)
+
+SIDO_ALIASES = {
+    "서울특별시": "서울", "부산광역시": "부산", "대구광역시": "대구", "인천광역시": "인천",
+    "광주광역시": "광주", "대전광역시": "대전", "울산광역시": "울산", "세종특별자치시": "세종",
+    "경기도": "경기", "강원도": "강원", "강원특별자치도": "강원", "충청북도": "충북", "충청남도": "충남",
+    "전라북도": "전북", "전북특별자치도": "전북", "전라남도": "전남", "경상북도": "경북", "경상남도": "경남",
+    "제주특별자치도": "제주",
+}
+
+
+def _clean(text, noise):
+    text = noise.sub('', text)
+    return _SPACES.sub(' ', text).strip(_EDGE_CHARS)
+
+
+def normalize_phone(text):
+    # 숫자만 남겨 지역번호 / 대표번호 / 안심번호 형식으로 다시 하이픈을 넣는다. 알 수 없는 형식은 None
+    digits = _NON_DIGITS.sub('', text or '')
+    length = len(digits)
+    if length == 8 and digits[0] == '1':
+        return f"{digits[:4]}-{digits[4:]}"
+    if digits.startswith('050') and length == 12:
+        return f"{digits[:4]}-{digits[4:8]}-{digits[8:]}"
+    if digits.startswith('02') and length in (9, 10):
+        return f"02-{digits[2:-4]}-{digits[-4:]}"
+    if digits.startswith('0') and length in (10, 11):
+        return f"{digits[:3]}-{digits[3:-4]}-{digits[-4:]}"
+    return None
+
+
+def parse_address(text):
+    # 주소 → {"sido"(약칭), "sigungu", "street"(도로명 / 동·리), "number"(건물번호 / 번지), "detail"} (해석 못 하면 None)
+    match = _ADDRESS.match(text) if text and text != NO_INFO else None
+    if match is None:
+        return None
+    parts = {key: value or '' for key, value in match.groupdict().items()}
+    parts["sido"] = SIDO_ALIASES.get(parts["sido"], parts["sido"])
+    return parts
+
+
+@lru_cache(maxsize=65536)
+def address_key(text):
+    # 같은 주소의 표기 차이(시도 약칭, 띄어쓰기, 상세주소)를 무시하는 비교용 키
+    parts = parse_address(text)
+    if parts is None:
+        return (text or '').translate(_NO_SPACES)
+    return f"{parts['sido']}|{parts['sigungu']}|{parts['street']}|{parts['number']}".translate(_NO_SPACES)
+
+
+def normalize_raw(raw):
+    # 원본 텍스트 묶음 {"name": [...], "address": [...], "phone": [...]} → [장소명, 도로명, 지번, 전화번호]
+    name = NO_INFO
+    for text in raw.get("name", []):
+        text = _clean(text, _NAME_NOISE)
+        if text:
+            name = text
+            break
+    if name == NO_INFO:
+        return None
+
+    road_address = NO_INFO
+    jibun_address = NO_INFO
+    for text in raw.get("address", []):
+        text = _clean(text, _ADDRESS_NOISE)
+        if road_address == NO_INFO and _ROAD_HINT.search(text):
+            road_address = text
+        elif jibun_address == NO_INFO and _JIBUN_HINT.search(text):
+            jibun_address = text
+
+    phone = NO_INFO
+    for text in raw.get("phone", []):
+        text = _clean(text, _PHONE_NOISE)
+        phone = normalize_phone(text) or text or NO_INFO
+        break
+
+    return [name, road_address, jibun_address, phone]
+
+
+def normalize_raws(raws):
+    # 여러 장소를 한 번에 정제 (이름이 없는 항목은 None)
+    return [normalize_raw(raw) for raw in raws]
+
+
+def normalize_row(row):
+    # 이미 행 형태인 값(HTTP 수집 / 저장된 파일)을 같은 규칙으로 다시 정제
+    name, road_address, jibun_address, phone = (list(row) + [NO_INFO] * 4)[:4]
+    phone = phone or NO_INFO
+    if phone != NO_INFO:
+        phone = normalize_phone(phone) or _clean(phone, _PHONE_NOISE) or NO_INFO
+    return [_clean(name or '', _NAME_NOISE) or NO_INFO,
+            _clean(road_address or '', _ADDRESS_NOISE) or NO_INFO,
+            _clean(jibun_address or '', _ADDRESS_NOISE) or NO_INFO,
+            phone]
+
+
+def _digest(text):
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+class Deduplicator:
+    # 장소 ID가 있는 행은 ID로만 비교한다. (같은 건물에 대표번호를 같이 쓰는 다른 장소를 합치지 않도록)
+    # ID가 없는 행(저장된 파일 등)은 (전화번호 + 주소), (장소명 + 주소) 중 하나라도 이미 본 행이면 중복으로 본다.
+    # 키 문자열 대신 8바이트 해시 정수만 보관하므로 수십만 행을 합쳐도 메모리가 작다.
+    def __init__(self):
+        self.duplicates = 0
+        self._ids = set()
+        self._seen = set()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._ids) + len(self._seen)
+
+    def keys(self, row):
+        name, road_address, jibun_address, phone = row[:4]
+        address = road_address if road_address != NO_INFO else jibun_address
+        if address == NO_INFO:
+            return [_digest(f"row:{'|'.join(row[:4])}")]
+        location = address_key(address)
+        keys = [_digest(f"name:{name.translate(_NO_SPACES).lower()}|{location}")]
+        if phone != NO_INFO:
+            keys.append(_digest(f"phone:{_NON_DIGITS.sub('', phone)}|{location}"))
+        return keys
+
+    def add(self, row, place_id=None):
+        # 처음 보는 행이면 True (색인에 추가), 중복이면 False
+        keys = self.keys(row)
+        with self._lock:
+            if place_id:
+                key = _digest(f"id:{place_id}")
+                duplicate = key in self._ids
+                self._ids.add(key)
+            else:
+                duplicate = any(key in self._seen for key in keys)
+            if duplicate:
+                self.duplicates += 1
+                return False
+            # ID가 있는 행도 내용 키를 남겨, 나중에 들어오는 ID 없는 같은 장소는 걸러낸다.
+            self._seen.update(keys)
+            return True
+
+
+def read_rows(path):
+    # 내보낸 csv / xlsx / parquet에서 [장소명, 도로명, 지번, 전화번호] 행을 하나씩 읽는다.
+    # (번호 열 / 안내 문구 행은 건너뜀)
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".parquet":
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=1000):
+            for values in zip(*(column.to_pylist() for column in batch.columns[1:5])):
+                yield ["" if value is None else str(value) for value in values]
+    elif extension == ".xlsx":
+        import openpyxl
+        workbook = openpyxl.load_workbook(path, read_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            yield from _data_rows(["" if value is None else str(value) for value in values] for values in rows)
+        finally:
+            workbook.close()
+    else:
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            yield from _data_rows(csv.reader(f))
+
+
+def _data_rows(rows):
+    header_seen = False
+    for values in rows:
+        if not header_seen:
+            header_seen = "장소명" in values
+            continue
+        if len(values) >= 5 and values[1]:
+            yield values[1:5]
+
+
+def merge_files(paths, output_path, dedupe=None):
+    # 여러 검색어 결과 파일을 정규화 + 중복 제거해서 하나로 합친다. (스풀 파일에 스트리밍, 메모리는 해시 색인만)
+    from exporter import StreamingExporter
+
+    dedupe = dedupe or Deduplicator()
+    spool = StreamingExporter(f"{output_path}.partial.csv", flush_every=1000, dedupe=dedupe)
+    total = 0
+    written = 0
+    try:
+        for path in paths:
+            for row in read_rows(path):
+                total += 1
+                if spool.append(normalize_row(row)):
+                    written += 1
+        spool.export(output_path)
+    finally:
+        spool.discard()
+    return {"input": total, "output": written, "duplicates": total - written}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="검색어별 결과 파일 합치기 (정규화 + 중복 제거)")
+    parser.add_argument("output", help="합친 결과 파일 (.xlsx / .csv / .parquet)")
+    parser.add_argument("inputs", nargs="+", help="합칠 결과 파일 (.xlsx / .csv / .parquet)")
+    args = parser.parse_args(argv)
+    stats = merge_files(args.inputs, args.output)
+    print(f"입력 {stats['input']}행 → 출력 {stats['output']}행 (중복 {stats['duplicates']}행 제거)")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,153 @@
+import os
+import time
+import sqlite3
+import threading
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".naver_map_crawler", "place_cache.sqlite3")
+DEFAULT_TTL = 7 * 24 * 3600     # 7일
+DEFAULT_MAX_ENTRIES = 100000
+ACCESS_FLUSH_SIZE = 200         # 적중 시각(accessed_at)을 이만큼 모아서 한 번에 기록
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS places (
+    place_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    road_address TEXT,
+    jibun_address TEXT,
+    phone TEXT,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS places_accessed_at ON places (accessed_at);
+"""
+
+
+class PlaceCache:
+    # 장소 ID → [장소명, 도로명, 지번, 전화번호] 로컬 캐시 (SQLite)
+    # ttl이 지난 항목은 미스로 처리하고, max_entries를 넘으면 가장 오래 안 쓴 항목부터 지운다.
+    # 적중할 때마다 커밋하지 않도록 accessed_at 갱신은 메모리에 모았다가 한 번에 기록하고,
+    # 항목 수도 메모리에서 세어 한도를 넘었을 때만 실제 개수를 다시 확인한다.
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._size = self.conn.execute("SELECT COUNT(*) FROM places").fetchone()[0]
+        self._accessed = {}
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        # 지난 실행에서 만료된 항목은 열 때 한 번에 지운다. (조회 때 하나씩 지우는 것은 그 뒤에 만료된 항목만)
+        self.purge_expired()
+
+    def get(self, place_id):
+        now = time.time()
+        with self._lock:
+            found = self.conn.execute(
+                "SELECT name, road_address, jibun_address, phone, fetched_at FROM places WHERE place_id = ?",
+                (str(place_id),),
+            ).fetchone()
+            if found is None:
+                self.misses += 1
+                return None
+            if self.ttl is not None and now - found[4] > self.ttl:
+                cursor = self.conn.execute("DELETE FROM places WHERE place_id = ?", (str(place_id),))
+                self.conn.commit()
+                self._accessed.pop(str(place_id), None)
+                self._size = max(0, self._size - cursor.rowcount)
+                self.expired += 1
+                self.misses += 1
+                return None
+            self._accessed[str(place_id)] = now
+            if len(self._accessed) >= ACCESS_FLUSH_SIZE:
+                self._flush_accessed()
+                self.conn.commit()
+            self.hits += 1
+            return list(found[:4])
+
+    def put(self, place_id, row):
+        now = time.time()
+        with self._lock:
+            values = (row[0], row[1], row[2], row[3], now, now, str(place_id))
+            cursor = self.conn.execute(
+                "UPDATE places SET name = ?, road_address = ?, jibun_address = ?, phone = ?, "
+                "fetched_at = ?, accessed_at = ? WHERE place_id = ?",
+                values,
+            )
+            if not cursor.rowcount:
+                self.conn.execute(
+                    "INSERT INTO places (name, road_address, jibun_address, phone, fetched_at, accessed_at, place_id) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    values,
+                )
+                self._size += 1
+            self._accessed.pop(str(place_id), None)
+            if self.max_entries and self._size > self.max_entries:
+                self._evict()
+            self.conn.commit()
+
+    def _flush_accessed(self):
+        if self._accessed:
+            self.conn.executemany("UPDATE places SET accessed_at = ? WHERE place_id = ?",
+                                  [(accessed_at, place_id) for place_id, accessed_at in self._accessed.items()])
+            self._accessed.clear()
+
+    def _evict(self):
+        # 다른 프로세스와 파일을 같이 쓸 수 있으므로 지우기 전에 실제 개수를 확인한다.
+        # 한도에 닿을 때마다 한 줄씩 지우지 않도록 1%를 더 비운다.
+        self._flush_accessed()
+        self._size = self.conn.execute("SELECT COUNT(*) FROM places").fetchone()[0]
+        overflow = self._size - self.max_entries
+        if overflow > 0:
+            overflow += self.max_entries // 100
+            cursor = self.conn.execute(
+                "DELETE FROM places WHERE place_id IN "
+                "(SELECT place_id FROM places ORDER BY accessed_at LIMIT ?)",
+                (overflow,),
+            )
+            self._size -= cursor.rowcount
+            self.evictions += cursor.rowcount
+
+    def flush(self):
+        with self._lock:
+            self._flush_accessed()
+            self.conn.commit()
+
+    def purge_expired(self):
+        if self.ttl is None:
+            return 0
+        with self._lock:
+            cursor = self.conn.execute("DELETE FROM places WHERE fetched_at < ?", (time.time() - self.ttl,))
+            self.conn.commit()
+            self._size = max(0, self._size - cursor.rowcount)
+            self.expired += cursor.rowcount
+            return cursor.rowcount
+
+    def __len__(self):
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM places").fetchone()[0]
+
+    def stats(self):
+        # 크롤링이 끝날 때마다 불리므로 모아둔 적중 시각도 여기서 기록한다.
+        self.flush()
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+    def close(self):
+        with self._lock:
+            self._flush_accessed()
+            self.conn.commit()
+            self.conn.close()
@@ -0,0 +1,202 @@
+from selenium.common.exceptions import TimeoutException
+from selector_registry import SelectorRegistry
+from normalize import normalize_raw, normalize_raws
+
+# 검색 목록의 장소 링크 후보
+PLACE_SELECTORS = [
+    "a.place_bluelink",
+    "a[class*='place_bluelink']",
+    ".place_bluelink",
+    "span.YwYLL",
+    "a[role='button']",
+    ".VLTHu.OW9LQ"
+]
+NAME_SELECTORS = [".YwYLL", ".GHAhO", "span.YwYLL", "h2.YwYLL"]
+PHONE_BUTTON_SELECTORS = [".BfF3H", ".U7pYf", "button[aria-label*='전화']"]
+PHONE_SELECTORS = [".J7eF_", ".xlx7Q", ".RiCN3", "span.xlx7Q", "a[href^='tel:']"]
+
+# SelectorRegistry에 등록하는 셀렉터 그룹
+SELECTOR_GROUPS = {
+    "place_list": PLACE_SELECTORS,
+    "name": NAME_SELECTORS,
+    "address_button": ["a.PkgBl"],
+    "address": ["div.nQ7Lh"],
+    "phone_button": PHONE_BUTTON_SELECTORS,
+    "phone": PHONE_SELECTORS,
+}
+# 그룹별로 이 패턴에 맞는 텍스트가 있어야 성공으로 본다.
+FIELD_PATTERNS = {
+    "name": r"\S",
+    "phone": r"\d{2,}",
+}
+
+# searchIframe 안에서 목록 순서대로 장소 ID를 모은다.
+# 링크의 data-id / href 를 먼저 보고, 없으면 Apollo 상태의 키(PlaceSummary:123 등)를 사용
+_HARVEST_IDS_JS = """
+var ids = [];
+var seen = {};
+function add(id) {
+    if (id && !seen[id]) { seen[id] = true; ids.push(String(id)); }
+}
+var links = document.querySelectorAll(arguments[0]);
+for (var i = 0; i < links.length; i++) {
+    var el = links[i].closest('a') || links[i];
+    var li = el.closest('li');
+    var id = el.getAttribute('data-id') || (li && (li.getAttribute('data-id') || li.getAttribute('data-laim-exp-id')));
+    if (!id) {
+        var m = (el.getAttribute('href') || '').match(/place\\/(\\d+)/);
+        id = m && m[1];
+    }
+    add(id);
+}
+if (!ids.length && window.__APOLLO_STATE__) {
+    Object.keys(window.__APOLLO_STATE__).forEach(function (key) {
+        var m = key.match(/^[A-Za-z]*Summary:(\\d+)$/);
+        if (m) add(m[1]);
+    });
+}
+return ids;
+"""
+
+
+def harvest_place_ids(driver):
+    # 현재 searchIframe에 렌더링된 장소 ID 목록
+    return driver.execute_script(_HARVEST_IDS_JS, ", ".join(PLACE_SELECTORS)) or []
+
+
+_ELEMENT_ID_JS = """
+var el = arguments[0].closest('a') || arguments[0];
+var li = el.closest('li');
+var id = el.getAttribute('data-id') || (li && (li.getAttribute('data-id') || li.getAttribute('data-laim-exp-id')));
+if (!id) {
+    var m = (el.getAttribute('href') || '').match(/place\\/(\\d+)/);
+    id = m && m[1];
+}
+return id ? String(id) : null;
+"""
+
+
+def element_place_id(driver, element):
+    # 목록 요소 하나의 장소 ID (없으면 None)
+    try:
+        return driver.execute_script(_ELEMENT_ID_JS, element)
+    except Exception:
+        return None
+
+
+def entry_url(base_url, place_id):
+    return f"{base_url}/p/entry/place/{place_id}"
+
+
+def open_place_entry(driver, waiter, base_url, place_id):
+    # 검색→클릭 없이 상세 페이지를 직접 열고 entryIframe으로 전환
+    driver.get(entry_url(base_url, place_id))
+    waiter.frame("entry_frame", "entryIframe")
+
+
+# entryIframe 안에서 한 번에 실행되는 추출 스크립트 (execute_async_script)
+# 1) 이름이 렌더링될 때까지 대기  2) 주소/전화번호 펼치기 버튼 클릭
+# 3) 펼쳐진 내용이 나타날 때까지 대기  4) 모든 그룹의 결과를 JSON으로 반환
+_EXTRACT_ENTRY_JS = """
+var plan = arguments[0], contentTimeout = arguments[1], expandTimeout = arguments[2];
+var done = arguments[arguments.length - 1];
+var groups = {};
+plan.forEach(function (group) { groups[group[0]] = group; });
+
+function first(name) {
+    var group = groups[name], selectors = group[1];
+    var pattern = group[2] ? new RegExp(group[2]) : null;
+    for (var i = 0; i < selectors.length; i++) {
+        var elements = document.querySelectorAll(selectors[i]);
+        var texts = [];
+        for (var j = 0; j < elements.length; j++) {
+            var text = (elements[j].innerText || elements[j].textContent || '').trim();
+            if (!pattern || pattern.test(text)) texts.push(text);
+        }
+        if (elements.length && (!pattern || texts.length)) {
+            return {index: i, texts: texts, element: elements[0]};
+        }
+    }
+    return null;
+}
+
+function waitFor(check, timeout, callback) {
+    var start = Date.now();
+    (function poll() {
+        var result = check();
+        if (result || Date.now() - start >= timeout) return callback(result, Date.now() - start);
+        setTimeout(poll, 50);
+    })();
+}
+
+function pack(result) {
+    var out = {};
+    Object.keys(result).forEach(function (name) {
+        var found = result[name];
+        out[name] = found ? {index: found.index, texts: found.texts} : {index: -1, texts: []};
+    });
+    return out;
+}
+
+waitFor(function () { return first('name'); }, contentTimeout, function (name, contentMs) {
+    if (!name) return done({ready: false, content_ms: contentMs, groups: pack({name: null})});
+    var addressButton = first('address_button');
+    var phoneButton = first('phone_button');
+    if (addressButton) addressButton.element.click();
+    if (phoneButton) phoneButton.element.click();
+    var expanded = {};
+    waitFor(function () {
+        expanded.address = first('address');
+        expanded.phone = first('phone');
+        return (!addressButton || expanded.address) && (!phoneButton || expanded.phone);
+    }, (addressButton || phoneButton) ? expandTimeout : 0, function (ok, expandMs) {
+        done({
+            ready: true,
+            content_ms: contentMs,
+            expand_ms: expandMs,
+            groups: pack({
+                name: name,
+                address_button: addressButton,
+                phone_button: phoneButton,
+                address: expanded.address,
+                phone: expanded.phone
+            })
+        });
+    });
+});
+"""
+
+ENTRY_GROUPS = ["name", "address_button", "phone_button", "address", "phone"]
+
+
+def extract_raw_fields(driver, waiter, registry):
+    # WebDriver 호출 한 번으로 entryIframe의 원본 텍스트를 모두 가져온다.
+    plan = registry.plan(ENTRY_GROUPS, FIELD_PATTERNS)
+    content_timeout = waiter.timeouts.get("entry_content", 3)
+    expand_timeout = waiter.timeouts.get("detail_expand", 1)
+    result = driver.execute_async_script(
+        _EXTRACT_ENTRY_JS, plan, int(content_timeout * 1000), int(expand_timeout * 1000)
+    ) or {}
+
+    waiter.record("entry_content", result.get("content_ms", 0) / 1000)
+    if not result.get("ready"):
+        raise TimeoutException("entryIframe 상세 정보가 렌더링되지 않았습니다.")
+    waiter.record("detail_expand", result.get("expand_ms", 0) / 1000)
+    return registry.learn(plan, result.get("groups", {}))
+
+
+def clean_record(raw):
+    # 원본 텍스트 묶음 {"name": [...], "address": [...], "phone": [...]} → 행
+    return normalize_raw(raw)
+
+
+def clean_records(raws):
+    # 여러 장소의 원본 텍스트를 한 번에 정제 (이름이 없는 항목은 None)
+    return normalize_raws(raws)
+
+
+def extract_place_info(driver, waiter, registry=None):
+    # entryIframe으로 전환된 상태에서 [장소명, 도로명, 지번, 전화번호] 추출
+    if registry is None:
+        registry = SelectorRegistry(None, SELECTOR_GROUPS)
+    return clean_records([extract_raw_fields(driver, waiter, registry)])[0]
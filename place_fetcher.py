@@ -0,0 +1,152 @@
+import re
+import json
+from urllib.parse import quote
+import urllib3
+
+from normalize import NO_INFO, normalize_phone
+from throttle import OK, ERROR, TIMEOUT, THROTTLED, BLOCKED, is_block_page
+
+# 브라우저 없이 장소 상세 페이지(pcmap.place.naver.com)를 받아와
+# 페이지에 포함된 Apollo 상태 JSON에서 필드를 꺼낸다.
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9",
+    "Referer": "https://map.naver.com/",
+}
+
+_APOLLO_MARKER = re.compile(r"window\.__APOLLO_STATE__\s*=\s*")
+_SUMMARY_KEY = re.compile(r"^[A-Za-z]*Summary:(\d+)$")
+
+
+class PlaceFetchError(Exception):
+    def __init__(self, place_id, message, status=None):
+        super().__init__(f"{place_id}: {message}")
+        self.place_id = place_id
+        self.status = status
+
+
+class PlaceBlockedError(PlaceFetchError):
+    # 캡차 / 접근 제한 페이지가 돌아온 경우 (속도를 크게 늦추고 연결을 새로 맺어야 함)
+    pass
+
+
+def fetch_outcome(error):
+    # 실패한 요청을 AdaptiveThrottle에 알릴 결과로 분류 (404 같은 정상 응답은 혼잡 신호가 아님)
+    if isinstance(error, PlaceBlockedError):
+        return BLOCKED
+    if error.status == 429:
+        return THROTTLED
+    if error.status is None:
+        return TIMEOUT
+    if error.status >= 500:
+        return ERROR
+    return OK
+
+
+def parse_apollo_state(html):
+    match = _APOLLO_MARKER.search(html or "")
+    if not match:
+        return None
+    try:
+        state, _ = json.JSONDecoder().raw_decode(html, match.end())
+    except ValueError:
+        return None
+    return state if isinstance(state, dict) else None
+
+
+def _detail_base(state, place_id):
+    detail = state.get(f"PlaceDetailBase:{place_id}")
+    if detail:
+        return detail
+    for key, value in state.items():
+        if key.startswith("PlaceDetailBase:") and isinstance(value, dict):
+            return value
+    return None
+
+
+def parse_place_detail(html, place_id):
+    # 상세 페이지 HTML → [장소명, 도로명, 지번, 전화번호] (파싱 실패 시 None)
+    state = parse_apollo_state(html)
+    if not state:
+        return None
+    detail = _detail_base(state, place_id)
+    if not detail or not detail.get("name"):
+        return None
+
+    phone = ' '.join((detail.get("phone") or detail.get("virtualPhone") or "").split())
+    return [
+        detail["name"].strip(),
+        (detail.get("roadAddress") or "").strip() or NO_INFO,
+        (detail.get("address") or "").strip() or NO_INFO,
+        normalize_phone(phone) or phone or NO_INFO,
+    ]
+
+
+def parse_place_list(html):
+    # 검색 목록 페이지 HTML → 장소 ID 목록 (등장 순서 유지)
+    state = parse_apollo_state(html)
+    if not state:
+        return []
+    ids = []
+    for key in state:
+        match = _SUMMARY_KEY.match(key)
+        if match and match.group(1) not in ids:
+            ids.append(match.group(1))
+    return ids
+
+
+class HttpPlaceFetcher:
+    # urllib3 PoolManager로 연결을 재사용한다.
+    # base_url / http 를 바꿔 끼우면 로컬 스텁 서버로 테스트할 수 있다.
+    def __init__(self, base_url="https://pcmap.place.naver.com", http=None, timeout=5.0, pool_size=8, headers=None):
+        self.base_url = base_url.rstrip('/')
+        self.headers = dict(DEFAULT_HEADERS)
+        if headers:
+            self.headers.update(headers)
+        self.http = http or urllib3.PoolManager(
+            maxsize=pool_size,
+            block=False,
+            # 재시도는 호출하는 쪽(엔진 / 속도 조절기)이 맡고, 리다이렉트(카테고리 경로 등)만 따라간다.
+            # retries=False로 두면 urllib3 2.x는 리다이렉트도 따라가지 않아 3xx가 실패로 처리된다.
+            retries=urllib3.Retry(total=None, connect=0, read=0, status=0, redirect=5),
+            timeout=urllib3.Timeout(total=timeout),
+        )
+
+    def detail_url(self, place_id):
+        return f"{self.base_url}/place/{place_id}/home"
+
+    def list_url(self, keyword, bounds=None):
+        url = f"{self.base_url}/place/list?query={quote(keyword)}"
+        if bounds is not None:
+            # 지도 범위를 지정하면 그 안의 장소만 검색된다.
+            lng, lat = bounds.center
+            url += f"&x={lng:.6f}&y={lat:.6f}&bounds={quote(bounds.bounds_param())}"
+        return url
+
+    def get(self, url, place_id=None):
+        try:
+            response = self.http.request("GET", url, headers=self.headers)
+        except urllib3.exceptions.HTTPError as e:
+            raise PlaceFetchError(place_id, f"요청 실패: {e}")
+        text = response.data.decode('utf-8', errors='replace')
+        # 정상 페이지에는 항상 Apollo 상태가 있으므로 없을 때만 차단 문구를 찾는다.
+        if response.status == 403 or (not _APOLLO_MARKER.search(text) and is_block_page(text)):
+            raise PlaceBlockedError(place_id, f"접근 제한 (HTTP {response.status})", response.status)
+        if response.status != 200:
+            raise PlaceFetchError(place_id, f"HTTP {response.status}", response.status)
+        return text
+
+    def fetch(self, place_id):
+        return parse_place_detail(self.get(self.detail_url(place_id), place_id), place_id)
+
+    def search_ids(self, keyword, bounds=None):
+        return parse_place_list(self.get(self.list_url(keyword, bounds)))
+
+    def rotate(self):
+        # 차단됐을 때 열려 있던 연결을 모두 닫고 다음 요청부터 새로 맺는다.
+        self.http.clear()
+
+    def close(self):
+        self.http.clear()
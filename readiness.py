@@ -0,0 +1,124 @@
+import time
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from throttle import BLOCK_MARKERS
+
+# 단계별 기본 타임아웃 (초)
+DEFAULT_TIMEOUTS = {
+    "search_frame": 20,     # 첫 searchIframe 로딩
+    "search_list": 10,      # 검색 결과 목록 렌더링
+    "scroll_more": 2,       # 스크롤 후 추가 항목 렌더링
+    "next_page": 5,         # 다음 페이지 목록 렌더링
+    "return_search": 10,    # 항목마다 searchIframe 복귀
+    "entry_url": 5,         # 클릭 후 entryIframe 주소 변경
+    "entry_frame": 5,       # entryIframe 전환
+    "entry_content": 3,     # 상세 정보 렌더링
+    "detail_expand": 1,     # 주소/전화번호 동시 펼치기
+    "dom_stable": 2,        # DOM 변경이 멈출 때까지
+}
+
+# 페이지에 MutationObserver를 한 번만 설치하고 마지막 변경 시각을 기록
+_INSTALL_OBSERVER_JS = """
+if (!window.__crawlerObserver) {
+    window.__crawlerLastMutation = performance.now();
+    window.__crawlerObserver = new MutationObserver(function () {
+        window.__crawlerLastMutation = performance.now();
+    });
+    window.__crawlerObserver.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+}
+return performance.now() - window.__crawlerLastMutation;
+"""
+
+_ENTRY_SRC_JS = """
+var frame = document.getElementById('entryIframe');
+return frame ? frame.src : null;
+"""
+
+# 현재 최상위 문서가 캡차 / 접근 제한 페이지인지, 기대한 iframe이 있는지 확인
+_BLOCK_SIGNAL_JS = """
+var markers = arguments[0], frameId = arguments[1];
+var text = ((document.title || '') + ' ' + (document.body ? document.body.innerText : '')).slice(0, 50000).toLowerCase();
+var html = document.documentElement ? document.documentElement.innerHTML.slice(0, 50000).toLowerCase() : '';
+for (var i = 0; i < markers.length; i++) {
+    var marker = markers[i].toLowerCase();
+    if (text.indexOf(marker) >= 0 || html.indexOf(marker) >= 0) return 'captcha';
+}
+if (frameId && !document.getElementById(frameId)) return 'missing_' + frameId;
+return null;
+"""
+
+
+class ReadinessWaiter:
+    def __init__(self, driver, timeouts=None, poll_interval=0.1, quiet_period=0.3, metrics=None):
+        self.driver = driver
+        self.timeouts = dict(DEFAULT_TIMEOUTS)
+        if timeouts:
+            self.timeouts.update(timeouts)
+        self.poll_interval = poll_interval
+        self.quiet_period = quiet_period
+        self.metrics = metrics
+
+    def until(self, step, condition):
+        timeout = self.timeouts.get(step, 5)
+        start = time.perf_counter()
+        try:
+            return WebDriverWait(self.driver, timeout, poll_frequency=self.poll_interval).until(condition)
+        except TimeoutException:
+            if self.metrics is not None:
+                self.metrics.count("timeouts_total", stage=step)
+            raise
+        finally:
+            if self.metrics is not None:
+                self.metrics.observe(step, time.perf_counter() - start)
+
+    def frame(self, step, frame_id):
+        return self.until(step, EC.frame_to_be_available_and_switch_to_it((By.ID, frame_id)))
+
+    def selector(self, step, css_selectors):
+        # 후보 셀렉터 중 하나라도 나타나면 그 요소들을 반환
+        if isinstance(css_selectors, str):
+            css_selectors = [css_selectors]
+
+        def _any_present(driver):
+            for css in css_selectors:
+                elements = driver.find_elements(By.CSS_SELECTOR, css)
+                if elements:
+                    return elements
+            return False
+
+        return self.until(step, _any_present)
+
+    def dom_stable(self, step="dom_stable"):
+        quiet_ms = self.quiet_period * 1000
+
+        def _quiet(driver):
+            try:
+                return driver.execute_script(_INSTALL_OBSERVER_JS) >= quiet_ms
+            except WebDriverException:
+                return False
+
+        return self.until(step, _quiet)
+
+    def entry_src(self):
+        # 현재 문서(default content) 기준 entryIframe 주소
+        try:
+            return self.driver.execute_script(_ENTRY_SRC_JS)
+        except WebDriverException:
+            return None
+
+    def entry_url_change(self, previous_src, step="entry_url"):
+        def _changed(driver):
+            src = self.entry_src()
+            return src if src and src != previous_src else False
+
+        return self.until(step, _changed)
+
+    def block_signal(self, frame_id=None):
+        # 대기 시간이 초과됐을 때 원인이 차단인지 확인 ("captcha", "missing_<frame_id>" 또는 None)
+        try:
+            self.driver.switch_to.default_content()
+            return self.driver.execute_script(_BLOCK_SIGNAL_JS, BLOCK_MARKERS, frame_id)
+        except WebDriverException:
+            return None
@@ -0,0 +1,94 @@
+import os
+import json
+import threading
+
+DEFAULT_REGISTRY_PATH = os.path.join(os.path.expanduser("~"), ".naver_map_crawler", "selectors.json")
+
+
+class SelectorRegistry:
+    # 셀렉터별 성공/실패 횟수를 기록해 잘 맞는 셀렉터를 먼저 시도한다.
+    # 학습된 순위는 JSON 파일로 저장해 다음 실행에서도 사용한다.
+    def __init__(self, path=DEFAULT_REGISTRY_PATH, groups=None, metrics=None):
+        self.path = path
+        self.metrics = metrics
+        self.groups = {}
+        self.stats = {}
+        self._lock = threading.Lock()
+        for name, candidates in (groups or {}).items():
+            self.register(name, candidates)
+        self.load()
+
+    def register(self, name, candidates):
+        with self._lock:
+            self.groups[name] = list(candidates)
+            self.stats.setdefault(name, {})
+
+    def ranked(self, name):
+        with self._lock:
+            candidates = self.groups[name]
+            stats = self.stats.get(name, {})
+
+            def score(item):
+                # 성공률(사전확률 1/2) 높은 순, 같으면 원래 순서
+                index, selector = item
+                hits, misses = stats.get(selector, (0, 0))
+                return (-(hits + 1) / (hits + misses + 2), index)
+
+            return [selector for _, selector in sorted(enumerate(candidates), key=score)]
+
+    def record(self, name, selector, hit):
+        with self._lock:
+            hits, misses = self.stats.setdefault(name, {}).get(selector, (0, 0))
+            self.stats[name][selector] = (hits + 1, misses) if hit else (hits, misses + 1)
+        if self.metrics is not None:
+            self.metrics.count("selector_hits_total" if hit else "selector_misses_total", group=name)
+
+    def plan(self, names, patterns=None):
+        # 페이지 스크립트(place_extractor._EXTRACT_ENTRY_JS)에 넘길 [그룹명, 학습된 순서의 셀렉터, 텍스트 패턴] 목록
+        patterns = patterns or {}
+        return [[name, self.ranked(name), patterns.get(name)] for name in names]
+
+    def learn(self, plan, result):
+        # 스크립트 결과 {그룹명: {"index": 성공한 후보 위치(-1=실패), "texts": [...]}}를 학습에 반영하고
+        # 찾은 텍스트만 돌려준다.
+        found = {}
+        for name, selectors, _ in plan:
+            outcome = result.get(name) or {"index": -1, "texts": []}
+            index = outcome["index"]
+            for selector in selectors[:index if index >= 0 else len(selectors)]:
+                self.record(name, selector, False)
+            if index >= 0:
+                self.record(name, selectors[index], True)
+                found[name] = outcome["texts"]
+        return found
+
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        with self._lock:
+            for name, selectors in saved.items():
+                group = self.stats.setdefault(name, {})
+                for selector, counts in selectors.items():
+                    group[selector] = tuple(counts)
+
+    def save(self):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        # 여러 크롤러가 같은 레지스트리를 공유할 수 있으므로 쓰는 동안 잠근다.
+        with self._lock:
+            data = {name: {selector: list(counts) for selector, counts in group.items()}
+                    for name, group in self.stats.items()}
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+
+    def report(self):
+        with self._lock:
+            return {name: dict(group) for name, group in self.stats.items()}
@@ -0,0 +1,176 @@
+import math
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from place_fetcher import PlaceFetchError, PlaceBlockedError, fetch_outcome
+from throttle import OK, ERROR
+
+# 검색어 하나로는 목록 개수 제한 때문에 큰 지역을 다 훑을 수 없으므로
+# 지도 범위(타일)나 행정구역으로 나눠 여러 번 검색하고 장소 ID로 중복을 제거해 합친다.
+
+# HTTP 목록 페이지 한 번에 담기는 최대 장소 수. 이만큼 나오면 잘린 것으로 보고 타일을 더 나눈다.
+DEFAULT_RESULT_CAP = 50
+DEFAULT_MAX_DEPTH = 4
+
+# 대략적인 도시 범위 (경도/위도, 섬 지역 제외)
+CITY_BOUNDS = {
+    "서울": (126.764, 37.413, 127.184, 37.715),
+    "부산": (128.760, 34.880, 129.310, 35.390),
+    "인천": (126.370, 37.360, 126.800, 37.650),
+    "대구": (128.350, 35.600, 128.770, 36.020),
+    "대전": (127.250, 36.180, 127.560, 36.500),
+    "광주": (126.640, 35.050, 127.010, 35.260),
+    "울산": (128.960, 35.320, 129.460, 35.720),
+}
+
+DISTRICTS = {
+    "서울": ["강남구", "강동구", "강북구", "강서구", "관악구", "광진구", "구로구", "금천구", "노원구",
+           "도봉구", "동대문구", "동작구", "마포구", "서대문구", "서초구", "성동구", "성북구", "송파구",
+           "양천구", "영등포구", "용산구", "은평구", "종로구", "중구", "중랑구"],
+    "부산": ["강서구", "금정구", "기장군", "남구", "동구", "동래구", "부산진구", "북구", "사상구",
+           "사하구", "서구", "수영구", "연제구", "영도구", "중구", "해운대구"],
+    "인천": ["강화군", "계양구", "남동구", "동구", "미추홀구", "부평구", "서구", "연수구", "옹진군", "중구"],
+    "대구": ["군위군", "남구", "달서구", "달성군", "동구", "북구", "서구", "수성구", "중구"],
+    "대전": ["대덕구", "동구", "서구", "유성구", "중구"],
+    "광주": ["광산구", "남구", "동구", "북구", "서구"],
+    "울산": ["남구", "동구", "북구", "울주군", "중구"],
+}
+
+
+class BoundingBox(namedtuple("BoundingBox", "min_lng min_lat max_lng max_lat")):
+    @classmethod
+    def parse(cls, text):
+        # "126.76,37.41,127.18,37.71" 또는 도시 이름
+        if text in CITY_BOUNDS:
+            return cls(*CITY_BOUNDS[text])
+        values = [float(value) for value in text.replace(';', ',').split(',')]
+        if len(values) != 4:
+            raise ValueError(f"범위는 '최소경도,최소위도,최대경도,최대위도' 형식이어야 합니다: {text}")
+        box = cls(*values)
+        if box.min_lng >= box.max_lng or box.min_lat >= box.max_lat:
+            raise ValueError(f"범위의 최소값이 최대값보다 작아야 합니다: {text}")
+        return box
+
+    @property
+    def center(self):
+        return (self.min_lng + self.max_lng) / 2, (self.min_lat + self.max_lat) / 2
+
+    @property
+    def span(self):
+        return max(self.max_lng - self.min_lng, self.max_lat - self.min_lat)
+
+    def zoom(self):
+        # 화면(약 1400px)에 범위 전체가 들어오는 지도 확대 수준
+        return max(6, min(19, int(math.log2(1440 / max(self.span, 1e-6)))))
+
+    def split(self):
+        # 4등분 (남서, 남동, 북서, 북동)
+        lng, lat = self.center
+        return [
+            BoundingBox(self.min_lng, self.min_lat, lng, lat),
+            BoundingBox(lng, self.min_lat, self.max_lng, lat),
+            BoundingBox(self.min_lng, lat, lng, self.max_lat),
+            BoundingBox(lng, lat, self.max_lng, self.max_lat),
+        ]
+
+    def bounds_param(self):
+        return f"{self.min_lng:.6f};{self.min_lat:.6f};{self.max_lng:.6f};{self.max_lat:.6f}"
+
+    def map_param(self):
+        # map.naver.com 검색 URL의 c= 값 (중심 경도, 위도, 확대 수준)
+        lng, lat = self.center
+        return f"{lng:.6f},{lat:.6f},{self.zoom()},0,0,0,dh"
+
+
+class Shard(namedtuple("Shard", "keyword bounds depth place_ids")):
+    # 독립적으로 크롤링할 검색 단위 (bounds가 None이면 검색어만으로 검색)
+    def __new__(cls, keyword, bounds=None, depth=0, place_ids=None):
+        return super().__new__(cls, keyword, bounds, depth, place_ids)
+
+    @property
+    def label(self):
+        if self.bounds is None:
+            return self.keyword
+        return f"{self.keyword}@{self.bounds.bounds_param()}"
+
+
+def split_keyword_by_district(keyword, city=None):
+    # "카페 서울" → ["서울 강남구 카페", "서울 강동구 카페", ...]
+    tokens = keyword.split()
+    if city is None:
+        city = next((token for token in tokens if token in DISTRICTS), None)
+    if city not in DISTRICTS:
+        return [Shard(keyword)]
+    rest = " ".join(token for token in tokens if token != city) or keyword
+    return [Shard(f"{city} {district} {rest}") for district in DISTRICTS[city]]
+
+
+class ShardPlanner:
+    # 타일마다 HTTP 목록 페이지로 결과 수를 확인하고, 제한(cap)에 걸린 타일은 4등분해서 다시 확인한다.
+    # 확인 요청도 크롤링과 같은 사이트로 가므로 throttle을 함께 쓴다.
+    def __init__(self, fetcher, cap=DEFAULT_RESULT_CAP, max_depth=DEFAULT_MAX_DEPTH, concurrency=4,
+                 status_callback=None, throttle=None, block_retries=2):
+        self.fetcher = fetcher
+        self.cap = cap
+        self.max_depth = max_depth
+        self.concurrency = max(1, concurrency)
+        self.status_callback = status_callback or (lambda message: None)
+        self.throttle = throttle
+        self.block_retries = block_retries
+        self.probes = 0
+
+    def probe(self, shard):
+        # 차단된 확인은 실패로 보지 않고 (throttle이 쉬는 동안 기다렸다가) 다시 확인한다.
+        # 실패한 타일을 그대로 크롤링하면 목록 제한에 걸려 분할한 의미가 없어지기 때문이다.
+        for _ in range(self.block_retries + 1):
+            if self.throttle is not None:
+                self.throttle.acquire()
+            self.probes += 1
+            outcome = ERROR
+            started = time.perf_counter()
+            try:
+                place_ids = self.fetcher.search_ids(shard.keyword, shard.bounds)
+                outcome = OK
+                return place_ids
+            except PlaceBlockedError as e:
+                outcome = fetch_outcome(e)
+                self.fetcher.rotate()
+                self.status_callback(f"[분할] {shard.label} 확인 중 차단됨, 잠시 후 다시 확인합니다: {e}")
+            except PlaceFetchError as e:
+                outcome = fetch_outcome(e)
+                self.status_callback(f"[분할] {shard.label} 확인 실패: {e}")
+                return None
+            finally:
+                if self.throttle is not None:
+                    self.throttle.release(outcome, time.perf_counter() - started, "http_search")
+        self.status_callback(f"[분할] {shard.label} 확인이 계속 차단되어 나누지 않고 크롤링합니다.")
+        return None
+
+    def plan(self, keyword, bounds):
+        leaves = []
+        level = [Shard(keyword, bounds)]
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            while level:
+                next_level = []
+                for shard, place_ids in zip(level, executor.map(self.probe, level)):
+                    if place_ids is None:
+                        # 확인에 실패한 타일은 나누지 않고 그대로 크롤링한다.
+                        leaves.append(shard)
+                    elif len(place_ids) >= self.cap and shard.depth < self.max_depth:
+                        next_level.extend(Shard(keyword, tile, shard.depth + 1) for tile in shard.bounds.split())
+                    elif place_ids:
+                        leaves.append(shard._replace(place_ids=place_ids))
+                if next_level:
+                    self.status_callback(f"[분할] 결과가 많은 타일을 {len(next_level)}개로 나눠 다시 확인합니다.")
+                level = next_level
+        self.status_callback(f"[분할] '{keyword}' → 타일 {len(leaves)}개 (확인 {self.probes}회)")
+        return leaves
+
+
+def run_shards(shards, job, concurrency=2):
+    # 각 타일/구역을 독립된 크롤링 작업으로 병렬 실행하고 작업별 결과를 순서대로 돌려준다.
+    if concurrency <= 1 or len(shards) <= 1:
+        return [job(shard) for shard in shards]
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        return list(executor.map(job, shards))
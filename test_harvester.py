@@ -0,0 +1,46 @@
+from selenium.common.exceptions import TimeoutException
+
+from harvester import ResultHarvester, _SCROLL_JS
+
+
+class StubDriver:
+    # 스크롤할 때마다 batch_size개씩 더 렌더링되는 검색 목록
+    def __init__(self, total, batch_size):
+        self.ids = [str(1000000 + number) for number in range(total)]
+        self.rendered = batch_size
+        self.batch_size = batch_size
+
+    def execute_script(self, script, *args):
+        if script == _SCROLL_JS:
+            self.rendered += self.batch_size
+            return True
+        return self.ids[:self.rendered]
+
+
+class StubWaiter:
+    # 조건을 한 번만 확인하고, 만족하지 않으면 바로 타임아웃
+    def __init__(self, driver):
+        self.driver = driver
+
+    def until(self, step, condition):
+        result = condition(self.driver)
+        if not result:
+            raise TimeoutException(step)
+        return result
+
+
+def harvest(total, batch_size, max_count):
+    driver = StubDriver(total, batch_size)
+    return list(ResultHarvester(driver, StubWaiter(driver), max_count))
+
+
+def test_first_batch_larger_than_max_count():
+    assert harvest(10, 10, 3) == ["1000000", "1000001", "1000002"]
+
+
+def test_scrolls_until_max_count():
+    assert harvest(10, 2, 5) == [str(1000000 + number) for number in range(5)]
+
+
+def test_stops_when_list_runs_out():
+    assert len(harvest(4, 2, 10)) == 4
@@ -0,0 +1,67 @@
+import pytest
+
+from normalize import NO_INFO, Deduplicator, address_key, normalize_phone, normalize_raw, parse_address
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("02-123-4567", "02-123-4567"),
+    ("02 1234 5678", "02-1234-5678"),
+    ("(02)1234-5678", "02-1234-5678"),
+    ("0507-1234-5678", "0507-1234-5678"),
+    ("050712345678", "0507-1234-5678"),
+    ("1588-1234", "1588-1234"),
+    ("15881234", "1588-1234"),
+    ("031-123-4567", "031-123-4567"),
+    ("010 1234 5678", "010-1234-5678"),
+    ("1234", None),
+    ("", None),
+])
+def test_normalize_phone(text, expected):
+    assert normalize_phone(text) == expected
+
+
+def test_parse_address():
+    assert parse_address("서울특별시 강남구 테헤란로 152 강남파이낸스센터 2층") == {
+        "sido": "서울", "sigungu": "강남구", "street": "테헤란로", "number": "152", "detail": "강남파이낸스센터 2층",
+    }
+    assert parse_address("경기도 성남시 분당구 불정로 6")["sigungu"] == "성남시 분당구"
+    assert parse_address(NO_INFO) is None
+
+
+def test_address_key_ignores_sido_alias_spacing_and_detail():
+    assert address_key("서울특별시 강남구 테헤란로 152 2층") == address_key("서울 강남구  테헤란로 152")
+    assert address_key("서울 강남구 테헤란로 152") != address_key("서울 강남구 테헤란로 153")
+
+
+def test_normalize_raw_splits_road_and_jibun():
+    raw = {"name": ["카페 복사"], "address": ["도로명 서울 강남구 테헤란로 152 복사", "지번 서울 강남구 역삼동 737"],
+           "phone": ["전화번호 02-1234-5678 복사"]}
+    assert normalize_raw(raw) == ["카페", "서울 강남구 테헤란로 152", "서울 강남구 역삼동 737", "02-1234-5678"]
+    assert normalize_raw({"name": [], "address": []}) is None
+
+
+ROW = ["카페", "서울특별시 강남구 테헤란로 152", NO_INFO, "02-1234-5678"]
+
+
+def test_dedupe_by_place_id_keeps_distinct_ids_with_same_content():
+    dedupe = Deduplicator()
+    assert dedupe.add(ROW, "1")
+    assert dedupe.add(ROW, "2")
+    assert not dedupe.add(["다른 이름", NO_INFO, NO_INFO, NO_INFO], "1")
+    assert dedupe.duplicates == 1
+
+
+def test_dedupe_without_id_uses_content_keys():
+    dedupe = Deduplicator()
+    assert dedupe.add(ROW)
+    # 이름이 달라도 전화번호 + 주소가 같으면 같은 장소
+    assert not dedupe.add(["카페 본점", "서울 강남구 테헤란로 152", NO_INFO, "02 1234 5678"])
+    # 전화번호가 달라도 이름 + 주소가 같으면 같은 장소
+    assert not dedupe.add(["카페", "서울 강남구 테헤란로 152 1층", NO_INFO, "02-9999-9999"])
+    assert dedupe.add(["카페", "서울 강남구 테헤란로 153", NO_INFO, NO_INFO])
+
+
+def test_row_without_id_after_id_row_is_duplicate():
+    dedupe = Deduplicator()
+    assert dedupe.add(ROW, "1")
+    assert not dedupe.add(["카페", "서울 강남구 테헤란로 152", NO_INFO, NO_INFO])
@@ -0,0 +1,64 @@
+import pytest
+
+import place_cache
+from place_cache import PlaceCache
+
+ROW = ["카페", "서울 강남구 테헤란로 152", "서울 강남구 역삼동 737", "02-1234-5678"]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # 같은 시각에 기록된 항목끼리 순서가 섞이지 않도록 조회 / 저장마다 1초씩 흐르는 시계
+    now = [1000.0]
+
+    def tick():
+        now[0] += 1
+        return now[0]
+
+    monkeypatch.setattr(place_cache.time, "time", tick)
+    return now
+
+
+def test_evicts_least_recently_used_after_buffered_hits(clock):
+    cache = PlaceCache(":memory:", max_entries=3)
+    for place_id in ("a", "b", "c"):
+        cache.put(place_id, ROW)
+    # a의 적중 시각은 아직 메모리에만 있지만 정리 전에 기록되어야 한다.
+    assert cache.get("a") == ROW
+    cache.put("d", ROW)
+    assert cache.get("b") is None
+    assert [cache.get(place_id) is not None for place_id in ("a", "c", "d")] == [True, True, True]
+    assert cache.evictions == 1
+
+
+def test_ttl_expiry(clock):
+    cache = PlaceCache(":memory:", ttl=10)
+    cache.put("a", ROW)
+    assert cache.get("a") == ROW
+    clock[0] += 20
+    assert cache.get("a") is None
+    assert cache.expired == 1
+    assert cache._size == len(cache) == 0
+
+
+def test_size_stays_consistent_after_eviction(clock):
+    cache = PlaceCache(":memory:", max_entries=100)
+    for number in range(250):
+        cache.put(str(number), ROW)
+    # 같은 ID를 다시 저장해도 개수는 늘지 않는다.
+    cache.put("249", ROW)
+    assert cache._size == len(cache) <= 100
+    assert cache.evictions == 250 - len(cache)
+    assert cache.stats()["size"] == len(cache)
+
+
+def test_purges_expired_entries_on_open(clock, tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = PlaceCache(path, ttl=10)
+    cache.put("a", ROW)
+    cache.close()
+    clock[0] += 20
+    reopened = PlaceCache(path, ttl=10)
+    assert len(reopened) == reopened._size == 0
+    assert reopened.expired == 1
+    reopened.close()
@@ -0,0 +1,193 @@
+import re
+import time
+import asyncio
+import threading
+from collections import deque
+
+# 요청 결과를 보고 동시 요청 수 / 요청 간격을 조절하는 AIMD 방식 제어기
+# - 성공이 한 바퀴(현재 동시 수만큼) 쌓이면 동시 수 +1, 요청 간격은 조금씩 줄임 (additive increase)
+# - 오류 / 타임아웃 비율이 높거나 응답이 평소보다 크게 느려지면 동시 수를 절반, 간격을 두 배로 (multiplicative decrease)
+#   평소 지연시간은 단계(stage)별로 따로 잰다. (HTTP 요청 0.1초대와 브라우저 페이지 로딩 수 초를 섞지 않도록)
+# - 캡차 / 차단 페이지가 보이면 추가로 일정 시간 모든 요청을 멈춘다. (연속 차단 시 대기 시간 두 배)
+# 스레드(브라우저 워커)와 asyncio(AsyncCrawlEngine) 양쪽에서 같은 인스턴스를 공유할 수 있다.
+
+OK = "ok"
+ERROR = "error"
+TIMEOUT = "timeout"
+THROTTLED = "throttled"     # HTTP 429 등 서버가 직접 속도를 늦추라고 알린 경우
+BLOCKED = "blocked"         # 캡차 / 접근 제한 페이지, searchIframe 없음
+
+# 네이버 캡차 / 접근 제한 페이지에 나오는 문구
+BLOCK_MARKERS = [
+    "ncaptcha",
+    "captcha.naver",
+    "자동입력 방지",
+    "자동입력방지",
+    "비정상적인 접근",
+    "비정상적인 요청",
+    "과도한 접근",
+    "서비스 이용이 제한",
+    "일시적으로 제한",
+]
+_BLOCK_PATTERN = re.compile("|".join(re.escape(marker) for marker in BLOCK_MARKERS), re.IGNORECASE)
+
+
+class BlockedError(Exception):
+    # 검색 페이지 대신 캡차 / 접근 제한 페이지가 열린 경우
+    pass
+
+
+def is_block_page(text):
+    # 응답 본문이 캡차 / 접근 제한 페이지인지 (앞부분만 확인)
+    return bool(text) and _BLOCK_PATTERN.search(text[:50000]) is not None
+
+
+class AdaptiveThrottle:
+    def __init__(self, max_concurrency=4, min_concurrency=1, initial=None, min_interval=0.0, max_interval=10.0,
+                 window=20, error_threshold=0.25, latency_factor=3.0, cooldown=2.0,
+                 block_pause=30.0, max_block_pause=600.0, metrics=None, status_callback=None):
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.min_concurrency = max(1, min(int(min_concurrency), self.max_concurrency))
+        self.limit = float(min(self.max_concurrency, initial or self.max_concurrency))
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self.error_threshold = error_threshold
+        self.latency_factor = latency_factor
+        self.cooldown = cooldown
+        self.block_pause = block_pause
+        self.max_block_pause = max_block_pause
+        self.metrics = metrics
+        self.status_callback = status_callback or (lambda message: None)
+        self.active = 0
+        self.baselines = {}
+        self.paused_until = 0.0
+        self.stats = {"requests": 0, "increases": 0, "decreases": 0, "blocks": 0}
+        self._outcomes = deque(maxlen=max(2, window))
+        self._successes = 0
+        self._blocks_in_row = 0
+        self._next_start = 0.0
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def concurrency(self):
+        return max(self.min_concurrency, int(self.limit))
+
+    def try_acquire(self):
+        # 바로 요청해도 되면 자리를 잡고 0, 아니면 다시 시도할 때까지 기다릴 시간(초)
+        now = time.monotonic()
+        with self._lock:
+            if now < self.paused_until:
+                return self.paused_until - now
+            if self.active >= self.concurrency:
+                return 0.05
+            if now < self._next_start:
+                return self._next_start - now
+            self.active += 1
+            self._next_start = now + self.interval
+            self.stats["requests"] += 1
+            return 0.0
+
+    def acquire(self, stopped=None):
+        # 스레드용: 자리가 날 때까지 대기. stopped()가 True가 되면 자리 없이 False 반환
+        while True:
+            wait = self.try_acquire()
+            if not wait:
+                return True
+            if stopped is not None and stopped():
+                return False
+            time.sleep(min(wait, 0.5))
+
+    async def acquire_async(self):
+        while True:
+            wait = self.try_acquire()
+            if not wait:
+                return
+            await asyncio.sleep(min(wait, 0.5))
+
+    def release(self, outcome=OK, latency=None, stage=None):
+        # acquire한 요청 하나의 결과를 알려주고 자리를 반납한다. (outcome이 None이면 요청하지 않은 것으로 봄)
+        # stage: 지연시간을 비교할 요청 종류 (예: "http_fetch", "search_page", "place_page")
+        now = time.monotonic()
+        message = None
+        with self._lock:
+            self.active = max(0, self.active - 1)
+            if outcome is None:
+                return
+            self._outcomes.append(outcome != OK)
+            if outcome == BLOCKED:
+                message = self._blocked(now)
+            elif outcome == THROTTLED:
+                self._decrease(now, "throttled", force=True)
+            elif outcome == OK:
+                self._blocks_in_row = 0
+                if self._slow(latency, stage):
+                    self._decrease(now, "latency")
+                else:
+                    self._increase()
+            elif len(self._outcomes) * 2 >= self._outcomes.maxlen and \
+                    sum(self._outcomes) / len(self._outcomes) > self.error_threshold:
+                self._decrease(now, "errors")
+        if message:
+            self.status_callback(message)
+
+    def _slow(self, latency, stage=None):
+        # 같은 단계의 평소 지연시간(천천히 따라가는 이동 평균)보다 latency_factor배 이상 느리면 혼잡으로 본다.
+        # 느린 응답도 (latency_factor배로 잘라서) 평균에 반영해야 응답이 계속 느린 사이트에서 감속만 반복하지 않는다.
+        if latency is None:
+            return False
+        baseline = self.baselines.get(stage)
+        if baseline is None:
+            self.baselines[stage] = latency
+            return False
+        limit = baseline * self.latency_factor
+        self.baselines[stage] = baseline * 0.9 + min(latency, limit) * 0.1
+        return latency > limit
+
+    def _increase(self):
+        self._successes += 1
+        if self._successes < self.concurrency:
+            return
+        self._successes = 0
+        self.interval = max(self.min_interval, self.interval * 0.8)
+        if self.limit < self.max_concurrency:
+            self.limit = min(self.max_concurrency, self.limit + 1)
+            self.stats["increases"] += 1
+
+    def _decrease(self, now, reason, force=False):
+        # 한 번의 혼잡에 여러 요청이 동시에 실패해도 cooldown 안에서는 한 번만 줄인다.
+        if not force and now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self._successes = 0
+        self._outcomes.clear()
+        self.limit = max(self.min_concurrency, self.limit / 2)
+        self.interval = min(self.max_interval, max(self.interval * 2, 0.25))
+        self.stats["decreases"] += 1
+        if self.metrics is not None:
+            self.metrics.count("throttle_decreases_total", reason=reason)
+
+    def _blocked(self, now):
+        self.stats["blocks"] += 1
+        if self.metrics is not None:
+            self.metrics.count("blocks_total")
+        if now < self.paused_until:
+            # 이미 쉬는 중에 도착한 (같은 차단으로 실패한) 요청은 한 번으로 본다.
+            return None
+        self._blocks_in_row += 1
+        pause = min(self.max_block_pause, self.block_pause * 2 ** (self._blocks_in_row - 1))
+        self.paused_until = now + pause
+        self._decrease(now, "blocked", force=True)
+        return (f"[속도 조절] 차단 신호 감지, {pause:.0f}초 쉬고 동시 {self.concurrency}개 / "
+                f"간격 {self.interval:.2f}초로 다시 시작합니다.")
+
+    def report(self):
+        with self._lock:
+            return {
+                "concurrency": self.concurrency,
+                "interval": round(self.interval, 3),
+                "baseline_latency": {stage or "default": round(baseline, 3) for stage, baseline in self.baselines.items()},
+                "paused": max(0.0, round(self.paused_until - time.monotonic(), 1)),
+                **self.stats,
+            }
@@ -0,0 +1,172 @@
+import time
+import queue
+import threading
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from readiness import ReadinessWaiter
+from place_extractor import SELECTOR_GROUPS, open_place_entry, extract_raw_fields, clean_record
+from selector_registry import SelectorRegistry
+from browser_session import BrowserSessionManager, create_chrome_driver
+from throttle import OK, ERROR, TIMEOUT, BLOCKED
+
+_STOP = object()
+
+
+class BrowserWorkerPool:
+    # N개의 브라우저가 공유 작업 큐에서 장소 ID를 꺼내 상세 정보를 추출한다.
+    # 큐 크기를 제한해 생산자(검색 목록 수집)가 너무 앞서가지 않도록 한다.
+    def __init__(self, worker_count, base_url="https://map.naver.com", status_callback=None,
+                 driver_factory=create_chrome_driver, timeouts=None, queue_size=None,
+                 max_restarts=3, max_attempts=2, registry=None, row_callback=None, sessions=None, metrics=None,
+                 throttle=None):
+        self.worker_count = max(1, int(worker_count))
+        self.base_url = base_url.rstrip('/')
+        self.status_callback = status_callback or (lambda message: None)
+        # 세션 관리자를 넘겨받으면 크롤링 사이에도 브라우저를 재사용한다.
+        self.own_sessions = sessions is None
+        self.sessions = sessions or BrowserSessionManager(driver_factory, max_idle=0)
+        self.timeouts = timeouts
+        self.max_restarts = max_restarts
+        self.max_attempts = max_attempts
+        self.registry = registry or SelectorRegistry(None, SELECTOR_GROUPS)
+        self.row_callback = row_callback
+        self.metrics = metrics
+        # 워커 수는 상한이고, 실제로 동시에 페이지를 여는 수와 간격은 throttle이 조절한다.
+        self.throttle = throttle
+        self.tasks = queue.Queue(maxsize=queue_size or self.worker_count * 2)
+        self.results = {}
+        self.is_running = True
+        self._lock = threading.Lock()
+        self._threads = []
+
+    def start(self):
+        for worker_id in range(self.worker_count):
+            thread = threading.Thread(target=self._worker, args=(worker_id,), daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def submit(self, index, place_id):
+        # 큐가 가득 차면 빈 자리가 날 때까지 대기 (back-pressure)
+        while self.is_running and self._alive():
+            try:
+                self.tasks.put((index, place_id), timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def close(self):
+        # 모든 작업이 끝나면 제출 순서대로 정렬된 행을 반환
+        for _ in self._threads:
+            while self._alive():
+                try:
+                    self.tasks.put(_STOP, timeout=0.5)
+                    break
+                except queue.Full:
+                    continue
+        for thread in self._threads:
+            thread.join()
+        if self.own_sessions:
+            self.sessions.close()
+        return [self.results[index] for index in sorted(self.results)]
+
+    def stop(self):
+        self.is_running = False
+        # 대기 중인 작업을 비워 워커가 빨리 종료되도록 한다.
+        try:
+            while True:
+                self.tasks.get_nowait()
+        except queue.Empty:
+            pass
+
+    def _alive(self):
+        return any(thread.is_alive() for thread in self._threads)
+
+
+    def _worker(self, worker_id):
+        session = None
+        waiter = None
+        restarts = 0
+        label = f"[워커 {worker_id + 1}]"
+        try:
+            while True:
+                task = self.tasks.get()
+                if task is _STOP:
+                    break
+                if not self.is_running:
+                    continue
+                index, place_id = task
+
+                raw = None
+                for _ in range(self.max_attempts):
+                    if self.throttle is not None and not self.throttle.acquire(lambda: not self.is_running):
+                        break
+                    outcome = ERROR
+                    opened = None
+                    try:
+                        if session is None:
+                            session = self.sessions.acquire()
+                            waiter = ReadinessWaiter(session.driver, self.timeouts, metrics=self.metrics)
+                        opened = time.perf_counter()
+                        open_place_entry(session.driver, waiter, self.base_url, place_id)
+                        session.count_page()
+                        start = time.perf_counter()
+                        raw = extract_raw_fields(session.driver, waiter, self.registry)
+                        if self.metrics is not None:
+                            self.metrics.observe("extract", time.perf_counter() - start)
+                        outcome = OK
+                        break
+                    except TimeoutException:
+                        signal = waiter.block_signal() if waiter is not None else None
+                        if not signal:
+                            outcome = TIMEOUT
+                            self.status_callback(f"{label} {place_id} 상세 정보를 찾을 수 없음")
+                            break
+                        # 캡차 / 접근 제한: 브라우저(쿠키, 세션)를 교체하고 쉬었다가 같은 작업을 다시 시도
+                        outcome = BLOCKED
+                        self.status_callback(f"{label} 차단 신호({signal}), 브라우저를 교체합니다.")
+                        self.sessions.release(session, broken=True)
+                        session, waiter = None, None
+                    except WebDriverException as e:
+                        # 브라우저가 죽은 경우 새로 띄워서 같은 작업을 다시 시도
+                        message = str(e).strip().splitlines()[0] if str(e).strip() else type(e).__name__
+                        self.status_callback(f"{label} 브라우저 오류, 재시작합니다: {message}")
+                        if session is not None:
+                            self.sessions.release(session, broken=True)
+                        session, waiter = None, None
+                        restarts += 1
+                        if self.metrics is not None:
+                            self.metrics.count("browser_restarts_total")
+                        if restarts > self.max_restarts:
+                            break
+                    except Exception as e:
+                        self.status_callback(f"{label} {place_id} 처리 중 오류: {str(e)}")
+                        break
+                    finally:
+                        if self.throttle is not None:
+                            latency = time.perf_counter() - opened if opened else None
+                            self.throttle.release(outcome, latency, "place_page")
+
+                # 행마다 한 번만 정제해서 결과에 넣고, 스트리밍 저장이 필요하면 바로 넘긴다.
+                row = clean_record(raw) if raw and raw.get("name") else None
+                if row:
+                    with self._lock:
+                        self.results[index] = row
+                        done = len(self.results)
+                    self.status_callback(f"{label} ({done}) {row[0]} 정보 수집 완료")
+                    if self.row_callback is not None:
+                        self.row_callback(index, row)
+                elif self.metrics is not None:
+                    self.metrics.count("place_failures_total", source="pool")
+
+                if restarts > self.max_restarts:
+                    self.status_callback(f"{label} 재시작 한도 초과로 종료합니다.")
+                    break
+
+                # 페이지를 많이 연 브라우저는 반납해서 새 브라우저로 교체
+                if session is not None and self.sessions.max_pages and session.pages >= self.sessions.max_pages:
+                    self.sessions.release(session)
+                    session, waiter = None, None
+        finally:
+            if session is not None:
+                self.sessions.release(session)